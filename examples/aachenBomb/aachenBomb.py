@@ -1,7 +1,6 @@
 from pathlib import Path
 
 import coloredlogs
-import polars as pl
 
 from flowboost.manager.manager import Manager
 from flowboost.openfoam.case import Case
@@ -23,7 +22,7 @@ def max_temp_objective(case: Case):
         return None
 
     # Get peak temperature from function object output (as a Polars DF)
-    max_T = df.select(pl.max("volAverage(T)")).item()
+    max_T = df["volAverage(T)"].max()
 
     # Want to use Pandas instead?
     # df = df.to_pandas()
@@ -1,5 +1,6 @@
 import importlib.resources as pkg_resources
 import logging
+import os
 import shutil
 from pathlib import Path
 
@@ -7,6 +8,9 @@ import tomlkit
 
 DEFAULT_CONFIG_NAME: str = "flowboost_config.toml"
 
+# Maximum number of threads for concurrent file I/O, such as restoring cases
+MAX_IO_WORKERS: int = min(32, (os.cpu_count() or 1) * 4)
+
 
 def validate(config: dict) -> bool:
     """Validate the TOML configuration file.
@@ -2,7 +2,7 @@ import logging
 import shutil
 import subprocess
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from flowboost.manager.manager import Manager
 
@@ -72,6 +72,24 @@ class SGE(Manager):
 
         return False
 
+    def _finished_job_ids(self, job_ids: Iterable[str]) -> set[str]:
+        # One qstat call lists all queued and running jobs: any job that is
+        # not listed has ended
+        result = subprocess.run(["qstat"], capture_output=True, text=True)
+
+        if result.returncode != 0:
+            logging.warning(f"Querying job statuses failed: {result.stderr.strip()}")
+            return set()
+
+        # Rows start with the job ID, after the header and separator lines
+        listed_ids = {
+            fields[0]
+            for fields in map(str.split, result.stdout.splitlines())
+            if fields and fields[0].isdigit()
+        }
+
+        return set(job_ids) - listed_ids
+
     def _get_job_info(self, job_id: str) -> str:
         """Fetch job details from Sun Grid Engine using the given job_id."""
         cmd = ["qstat", "-j", job_id]
@@ -1,14 +1,16 @@
-import json
 import logging
 import shutil
 import time
 from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
+from flowboost.config import config
 from flowboost.openfoam.case import Case, Status
+from flowboost.utilities import serialization
 from flowboost.utilities.time import td_format
 
 SUPPORTED_SCHEDULERS = ("Local", "SGE")
@@ -115,6 +117,28 @@ class Manager(ABC):
     def _job_has_finished(self, job_id: str) -> bool:
         pass
 
+    def _finished_job_ids(self, job_ids: Iterable[str]) -> set[str]:
+        """
+        Returns the subset of `job_ids` that have finished. By default, each
+        job is queried with `_job_has_finished`, concurrently: interfaces
+        whose scheduler can report the state of many jobs in one query should
+        override this.
+
+        Args:
+            job_ids (Iterable[str]): Jobs to query
+
+        Returns:
+            set[str]: IDs of finished jobs
+        """
+        job_ids = list(job_ids)
+        if len(job_ids) <= 1:
+            return {job_id for job_id in job_ids if self._job_has_finished(job_id)}
+
+        workers = min(config.MAX_IO_WORKERS, len(job_ids))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            finished = pool.map(self._job_has_finished, job_ids)
+            return {job_id for job_id, done in zip(job_ids, finished) if done}
+
     @staticmethod
     def create(scheduler: str, wdir: Path, job_limit: int) -> "Manager":
         """
@@ -267,9 +291,8 @@ class Manager(ABC):
                     time.sleep(self.monitoring_interval)
                     continue
 
-            finished_jobs = {
-                job for job in self.job_pool if self._job_has_finished(job.id)
-            }
+            finished_ids = self._finished_job_ids(job.id for job in self.job_pool)
+            finished_jobs = {job for job in self.job_pool if job.id in finished_ids}
 
             if finished_jobs:
                 self.job_pool.difference_update(finished_jobs)
@@ -305,7 +328,8 @@ class Manager(ABC):
         not capable of supporting the detection of queued jobs, the parameter
         can be ignored.
         """
-        return [j for j in self.job_pool if not self._job_has_finished(j.id)]
+        finished_ids = self._finished_job_ids(j.id for j in self.job_pool)
+        return [j for j in self.job_pool if j.id not in finished_ids]
 
     def _status_print(self) -> str:
         if not self.job_pool and not self.acquisition_job:
@@ -343,24 +367,34 @@ class Manager(ABC):
         return Case(job.wdir)
 
     def _state(self) -> dict:
+        """
+        Manager state, excluding the job pool. The job pool is streamed to
+        the state file job by job in `_save_state`.
+
+        Returns:
+            dict: Manager state
+        """
         state = {
             "type": self.type,
             "wdir": str(self.wdir),
             "job_limit": self.job_limit,
             "job_prefix": self.job_prefix,
             "monitoring_interval": self.monitoring_interval,
-            "job_pool": [job.to_dict() for job in self.job_pool],
             "acquisition_job": None,
         }
 
         if self.acquisition_job:
-            state["acquisition_job"] = asdict(self.acquisition_job)
+            state["acquisition_job"] = self.acquisition_job.to_dict()
 
         return state
 
     def _save_state(self):
-        with open(Path(self.wdir, self.persistence_fname), "w") as f:
-            json.dump(self._state(), f, indent=4)
+        serialization.dump_streaming_list(
+            self._state(),
+            "job_pool",
+            (job.to_dict() for job in self.job_pool),
+            Path(self.wdir, self.persistence_fname),
+        )
 
     def _restore_state(self, wdir: Path):
         """
@@ -374,8 +408,7 @@ class Manager(ABC):
                 f"Manager state not found: {self.persistence_fname}"
             )
 
-        with open(Path(wdir, self.persistence_fname), "rb") as jsonf:
-            state = json.load(jsonf)
+        state = serialization.load(Path(wdir, self.persistence_fname))
 
         if state["type"] != self.type:
             raise ValueError(f"Manager mismatch ({state['type']} != {self.type})")
@@ -394,7 +427,7 @@ class Manager(ABC):
                 logging.info(f"\t[{i}] {job}")
 
         if state.get("acquisition_job", None):
-            self.acquisition_job = JobV2(**state["acquisition_job"])
+            self.acquisition_job = JobV2.from_dict(state["acquisition_job"])
             logging.info(f"Restored acquisition job: {self.acquisition_job}")
 
         logging.info("Restored job manager")
@@ -404,7 +437,7 @@ class Manager(ABC):
         return sep.join(f'{k}="{v}"' for k, v in args.items())
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobV2:
     id: str
     name: str
@@ -426,8 +459,11 @@ class JobV2:
             "created_at": self.created_at.isoformat(),
         }
 
-    @staticmethod
-    def from_dict(data: dict):
-        data["wdir"] = Path(data["wdir"])
-        data["created_at"] = datetime.fromisoformat(data["created_at"])
-        return JobV2(**data)
+    @classmethod
+    def from_dict(cls, data: dict) -> "JobV2":
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            wdir=Path(data["wdir"]),
+            created_at=datetime.fromisoformat(data["created_at"]),
+        )
@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from hashlib import blake2b
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Union
 from uuid import uuid4
 
 import tomlkit
@@ -478,6 +478,19 @@ class Case:
         with open(file, mode="r") as toml_file:
             data = tomlkit.load(toml_file)
 
+        return cls.from_metadata(data)
+
+    @classmethod
+    def from_metadata(cls, data: Mapping[str, Any]) -> "Case":
+        """
+        Restores a Case from the contents of its metadata file.
+
+        Args:
+            data (Mapping[str, Any]): Parsed metadata, see `Case.state()`
+
+        Returns:
+            Case: Restored case
+        """
         # Main properties
         case = cls(path=str(data["path"]))
         case.id = str(data["id"])
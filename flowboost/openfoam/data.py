@@ -1,11 +1,22 @@
 import logging
+import threading
+from collections import OrderedDict
 from enum import Enum
 from pathlib import Path
-from typing import Literal, Optional, Union
+from typing import Any, Literal, Optional, Union
 
 import pandas as pd
 import polars as pl
 
+from flowboost.utilities.time import mtime_is_settled
+
+# Loaded function object files kept in memory per Data instance
+_DATAFRAME_CACHE_SIZE: int = 32
+
+# Polars 1.25 replaced LazyFrame.collect(streaming=...) with collect(engine=...)
+_POLARS_VERSION = tuple(int(v) for v in pl.__version__.split(".")[:2])
+_POLARS_COLLECT_ENGINE: bool = _POLARS_VERSION >= (1, 25)
+
 
 class Backend(Enum):
     PANDAS = "pandas"
@@ -62,6 +73,13 @@ class Data:
                 f"Format '{dataframe_format}' not supported: should be in {list(Backend)}"
             )
 
+        # Loaded dataframes, keyed by file and reader arguments. Entries are
+        # validated against the file's modification time and size.
+        self._dataframe_cache: OrderedDict[tuple, tuple[tuple[int, int], Any]] = (
+            OrderedDict()
+        )
+        self._dataframe_cache_lock = threading.Lock()
+
     def time_directories(self):
         # Return all time directories
         # TODO do through case; this serves no purpose here
@@ -228,6 +246,15 @@ class Data:
             case Backend.POLARS:
                 return pl.concat(dfs)
 
+    def invalidate(self):
+        """
+        Drop all dataframes loaded from this case. Not required for files
+        that are rewritten, as cached data is validated against the file's
+        modification time and size; this only releases the memory.
+        """
+        with self._dataframe_cache_lock:
+            self._dataframe_cache.clear()
+
     def fields(self):
         pass
 
@@ -283,6 +310,36 @@ class Data:
 
     def _read_fo_to_dataframe(
         self, file: Path, comment="#", separator="\t"
+    ) -> pl.DataFrame:
+        """Cached front for `_load_fo_to_dataframe`. Callers receive a copy
+        of the cached dataframe (cheap for Polars), so it may be modified
+        freely. Recently modified files are not cached, see `mtime_is_settled`.
+        """
+        stat = file.stat()
+        key = (str(file), comment, separator, self.dataframe_format)
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._dataframe_cache_lock:
+            cached = self._dataframe_cache.get(key)
+            if cached and cached[0] == version:
+                self._dataframe_cache.move_to_end(key)
+                return _copy_dataframe(cached[1])
+
+        df = self._load_fo_to_dataframe(file, comment=comment, separator=separator)
+
+        if mtime_is_settled(stat.st_mtime_ns):
+            with self._dataframe_cache_lock:
+                self._dataframe_cache[key] = (version, df)
+                self._dataframe_cache.move_to_end(key)
+                if len(self._dataframe_cache) > _DATAFRAME_CACHE_SIZE:
+                    self._dataframe_cache.popitem(last=False)
+
+            return _copy_dataframe(df)
+
+        return df
+
+    def _load_fo_to_dataframe(
+        self, file: Path, comment="#", separator="\t"
     ) -> pl.DataFrame:
         """Reads a function object output file to a dataframe according to
         the specified backend. Should not be used for fields, or files where
@@ -309,7 +366,7 @@ class Data:
                 separator=separator,
                 new_columns=cols,
                 low_memory=self.low_memory,
-            ).collect(streaming=self.lazy_backend)
+            ).collect(**_collect_kwargs(streaming=self.lazy_backend))
 
         match self.dataframe_format:
             case Backend.PANDAS:
@@ -320,3 +377,15 @@ class Data:
                 raise NotImplementedError(
                     f"Backend '{self.dataframe_format}' not valid"
                 )
+
+
+def _copy_dataframe(df: pl.DataFrame | pd.DataFrame) -> pl.DataFrame | pd.DataFrame:
+    return df.clone() if isinstance(df, pl.DataFrame) else df.copy()
+
+
+def _collect_kwargs(streaming: bool) -> dict[str, Any]:
+    """Keyword arguments for `LazyFrame.collect` for the installed Polars."""
+    if _POLARS_COLLECT_ENGINE:
+        return {"engine": "streaming" if streaming else "auto"}
+
+    return {"streaming": streaming}
@@ -1,11 +1,32 @@
 import json
 import logging
+import os
+import re
 import subprocess
+import threading
+from collections import OrderedDict
 from functools import total_ordering
 from pathlib import Path
 from typing import Any, Optional, Union
 
 from flowboost.openfoam.types import FOAMType
+from flowboost.utilities.time import mtime_is_settled
+
+# Outputs of read-only foamDictionary queries, keyed by the (path, mtime,
+# size) of the queried file and its includes, and the query arguments, in LRU
+# order
+_QUERY_CACHE: OrderedDict[tuple, subprocess.CompletedProcess] = OrderedDict()
+_QUERY_CACHE_LOCK = threading.Lock()
+_QUERY_CACHE_SIZE: int = 8192
+
+# Include directives with a trackable target file, e.g. `#include "file"`
+_INCLUDE_RE = re.compile(r'#(?:s?include|includeIfPresent)\s+"([^"]+)"')
+
+# Directives and references that depend on files (or code) outside of the
+# dictionary's includes, e.g. `#includeEtc` or `${file!entry}`
+_UNTRACKED_RE = re.compile(
+    r"#(?:includeEtc|includeFunc|includeModel|calc|codeStream)\b|\$\{[^}]*!"
+)
 
 
 class Dictionary:
@@ -71,6 +92,23 @@ class Dictionary:
         """
         return DictionaryLink(relative_dictionary_path)
 
+    @staticmethod
+    def clear_query_cache(path: Optional[str | Path] = None):
+        """Clear the cached outputs of read-only foamDictionary queries.
+
+        Args:
+            path (Optional[str | Path], optional): Only clear queries that \
+                depend on this file. Defaults to None, which clears all.
+        """
+        with _QUERY_CACHE_LOCK:
+            if path is None:
+                _QUERY_CACHE.clear()
+                return
+
+            file = os.path.abspath(path)
+            for key in [k for k in _QUERY_CACHE if any(f[0] == file for f in k[0])]:
+                del _QUERY_CACHE[key]
+
 
 class DictionaryReader(Dictionary):
     """A lazy OpenFOAM dictionary reader that can be used to programmatically
@@ -189,6 +227,7 @@ class DictionaryReader(Dictionary):
         result = subprocess.run(
             cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
         )
+        Dictionary.clear_query_cache(self.path)
         if result.stderr:
             logging.error(f"Error adding new entry '{entry_path}': {result.stderr}")
             return None
@@ -241,11 +280,7 @@ class DictionaryReader(Dictionary):
         if self._keywords is None:
             self._keywords = []
 
-        cmd = ["foamDictionary", self.path, "-keywords"]
-
-        result = subprocess.run(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
+        result = _query_dictionary(self.path, "-keywords")
         if result.stderr:
             logging.error(f"Error discovering top-level keywords: {result.stderr}")
             return
@@ -299,14 +334,23 @@ class DictionaryLink:
         return new_link
 
     def reader(
-        self, case_path: str | Path
+        self,
+        case_path: str | Path,
+        dictionary_reader: Optional[DictionaryReader] = None,
     ) -> Optional[Union[DictionaryReader, "Entry"]]:
         """
         Convert this link into a DictionaryReader that resolves the linked entry path
         within the context of a given case directory.
+
+        Args:
+            case_path (str | Path): Case directory to resolve the link in
+            dictionary_reader (Optional[DictionaryReader], optional): An \
+                existing reader for the linked dictionary in `case_path`, \
+                whose already discovered entries are reused. Defaults to None.
         """
-        full_path = f"{case_path}/{self.path}"
-        reader = DictionaryReader(full_path)
+        reader = dictionary_reader
+        if reader is None:
+            reader = DictionaryReader(f"{case_path}/{self.path}")
 
         if self.entry_path:
             # If there's an entry path, resolve it to an Entry object
@@ -483,6 +527,7 @@ class Entry:
         result = subprocess.run(
             cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
         )
+        Dictionary.clear_query_cache(self.dictionary.path)
 
         if result.returncode != 0 or result.stderr:
             logging.error(
@@ -537,6 +582,7 @@ class Entry:
         result = subprocess.run(
             cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
         )
+        Dictionary.clear_query_cache(self.dictionary.path)
 
         if result.stderr:
             logging.error(
@@ -576,15 +622,8 @@ class Entry:
         """Discovers sub-entries for this entry, if not already known."""
         if self.terminating is not False:
             # This entry is either known to be terminating or not yet evaluated
-            cmd = [
-                "foamDictionary",
-                self.dictionary.path,
-                "-keywords",
-                "-entry",
-                self.print_path(),
-            ]
-            result = subprocess.run(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+            result = _query_dictionary(
+                self.dictionary.path, "-keywords", "-entry", self.print_path()
             )
             if result.stderr:
                 self.terminating = True
@@ -606,15 +645,8 @@ class Entry:
 
     def _discover_value(self):
         """Retrieves the value of a terminating entry using the foamDictionary CLI and stores both raw and processed values."""
-        cmd = [
-            "foamDictionary",
-            self.dictionary.path,
-            "-entry",
-            self.print_path(),
-            "-value",
-        ]
-        result = subprocess.run(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        result = _query_dictionary(
+            self.dictionary.path, "-entry", self.print_path(), "-value"
         )
 
         if result.stderr:
@@ -649,3 +681,91 @@ class Entry:
                 "Less than comparison is not implemented between Entry objects."
             )
         return self.value < other
+
+
+def _query_dictionary(path: str | Path, *args: str) -> subprocess.CompletedProcess:
+    """
+    Run a read-only `foamDictionary` query. Outputs are cached by the path,
+    mtime and size of the file and every file it includes, so repeated
+    queries on an unchanged dictionary do not spawn a new process. See
+    `_dictionary_signature` for the dictionaries that are never cached.
+
+    Args:
+        path (str | Path): Dictionary file to query
+        args (str): foamDictionary arguments, e.g. `"-keywords"`
+
+    Returns:
+        subprocess.CompletedProcess: Completed (or cached) query
+    """
+    cmd = ["foamDictionary", path, *args]
+
+    signature = _dictionary_signature(path)
+
+    key = None
+    if signature is not None:
+        key = (signature, args)
+        with _QUERY_CACHE_LOCK:
+            result = _QUERY_CACHE.get(key)
+            if result is not None:
+                _QUERY_CACHE.move_to_end(key)
+                return result
+
+    result = subprocess.run(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    )
+
+    if key is not None:
+        with _QUERY_CACHE_LOCK:
+            _QUERY_CACHE[key] = result
+            if len(_QUERY_CACHE) > _QUERY_CACHE_SIZE:
+                _QUERY_CACHE.popitem(last=False)
+
+    return result
+
+
+def _dictionary_signature(path: str | Path) -> Optional[tuple]:
+    """
+    Identify the contents of a dictionary by the (path, mtime, size) of the
+    file and, recursively, of every file it includes. Included files that do
+    not exist are part of the signature as (path, None, None).
+
+    Returns None, i.e. the dictionary is not cached, if the file does not
+    exist, if any of the files was recently modified (see `mtime_is_settled`),
+    or if the dictionary depends on files that cannot be tracked.
+    """
+    signature: list[tuple[str, Optional[int], Optional[int]]] = []
+    seen: set[str] = set()
+    pending = [os.path.abspath(path)]
+
+    while pending:
+        file = pending.pop()
+        if file in seen:
+            continue
+
+        seen.add(file)
+        try:
+            stat = os.stat(file)
+            with open(file, "r", errors="replace") as f:
+                text = f.read()
+        except OSError:
+            if not signature:
+                return None
+
+            signature.append((file, None, None))
+            continue
+
+        if not mtime_is_settled(stat.st_mtime_ns) or _UNTRACKED_RE.search(text):
+            return None
+
+        signature.append((file, stat.st_mtime_ns, stat.st_size))
+        for include in _INCLUDE_RE.findall(text):
+            include = os.path.expandvars(include)
+            if "$" in include:
+                # e.g. $FOAM_CASE, which is only set by OpenFOAM itself
+                return None
+
+            pending.append(
+                os.path.normpath(os.path.join(os.path.dirname(file), include))
+            )
+
+    return tuple(signature)
@@ -4,6 +4,12 @@ from typing import Any, Optional, Union
 
 import numpy as np
 
+# Special floating-point values accepted by the scalar parsers
+_SPECIAL_FLOATS = frozenset({"NaN", "nan", "inf", "-inf", "+inf"})
+
+# Dimension set of an entry, e.g. "[0 2 -1 0 0 0 0]"
+_DIMENSION_RE = re.compile(r"\[.*?\]")
+
 
 class FOAMType:
     @staticmethod
@@ -18,19 +24,27 @@ class FOAMType:
         Returns:
             tuple[str, str, Any]: The read (name, dimension, value) of the entry.
         """
-        # Use regex to search for dimension set
-        dimension_regex = re.compile(r"\[.*?\]")
-        dimension_match = dimension_regex.search(data)
+        # Locate the dimension set with plain substring searches. The regex
+        # is only needed if the brackets span multiple lines.
+        dim_start = data.find("[")
+        dim_end = data.find("]", dim_start + 1) if dim_start != -1 else -1
+
+        if dim_end != -1 and "\n" in data[dim_start:dim_end]:
+            dimension_match = _DIMENSION_RE.search(data)
+            dim_start, dim_end = (
+                (dimension_match.start(), dimension_match.end() - 1)
+                if dimension_match
+                else (-1, -1)
+            )
 
         # Initialize variables
         # https://doc.cfd.direct/openfoam/user-guide-v11/basic-file-format
         name, dimension, value = None, None, None
 
-        if dimension_match:
-            dimension = dimension_match.group(0)
-            before_dimension, _, after_dimension = data.partition(dimension)
-            name = before_dimension.strip()
-            value = after_dimension.strip()
+        if dim_end != -1:
+            dimension = data[dim_start : dim_end + 1]
+            name = data[:dim_start].strip()
+            value = data[dim_end + 1 :].strip()
         else:
             # Handle case without dimension
             parts = data.split()
@@ -142,7 +156,7 @@ class FOAMType:
             return None
 
         # Explicit check for special floating-point values
-        if s in {"NaN", "nan", "inf", "-inf", "+inf"}:
+        if s in _SPECIAL_FLOATS:
             return float(s)
 
         # Check if the string represents an integer value.
@@ -160,6 +174,20 @@ class FOAMType:
         # If none of the above, the string does not represent a numeric value.
         return None
 
+    @staticmethod
+    def try_parse_scalar_batch(strings: list[str]) -> list[Optional[Union[int, float]]]:
+        """
+        Batched `FOAMType.try_parse_scalar`, with identical parsing rules.
+
+        Args:
+            strings (list[str]): Strings to try converting
+
+        Returns:
+            list[Optional[Union[int, float]]]: Parsed strings, in order
+        """
+        parse = FOAMType.try_parse_scalar
+        return [parse(s) for s in strings]
+
     @staticmethod
     def parse_vector_space(data: str, parse_subdicts=True):
         # Clean up and prepare for parsing
@@ -172,19 +200,10 @@ class FOAMType:
             else:
                 return [data]  # Return as string if not parsing
 
-        numbers = [FOAMType.try_parse_scalar(num) for num in re.split(r"\s+", data)]
-
-        if len(numbers) == 1:
-            return numbers[0]  # Spherical Tensor
-        elif len(numbers) == 3:
-            return np.array(numbers)  # Vector
-        elif len(numbers) == 6:
-            # Symmetrical Tensor
-            return FOAMType.construct_symm_tensor(numbers)
-        elif len(numbers) == 9:
-            return np.array(numbers).reshape((3, 3))  # Tensor
-        else:
-            return np.array(numbers)  # Fallback, just in case
+        numbers = FOAMType.try_parse_scalar_batch(re.split(r"\s+", data))
+
+        # Construct by component count, falling back to a plain array
+        return _VECTOR_SPACE_CONSTRUCTORS.get(len(numbers), np.array)(numbers)
 
     @staticmethod
     def parse_subdict(data: str) -> dict:
@@ -220,6 +239,15 @@ class FOAMType:
         return tensor
 
 
+# Vector space constructors, keyed by the number of components
+_VECTOR_SPACE_CONSTRUCTORS = {
+    1: lambda numbers: numbers[0],  # Spherical Tensor
+    3: np.array,  # Vector
+    6: FOAMType.construct_symm_tensor,  # Symmetrical Tensor
+    9: lambda numbers: np.array(numbers).reshape((3, 3)),  # Tensor
+}
+
+
 class Switch(Enum):
     FALSE = False
     TRUE = True
@@ -7,15 +7,21 @@ The acquisition job is expected to produce one json-file, with the results
 of the acquisition.
 """
 
-import argparse
 import logging
-from datetime import datetime, timezone
+import sys
+import time
 from pathlib import Path
 
-from flowboost.optimizer.interfaces.Ax import AxBackend
 from flowboost.utilities.time import td_format
 
 OFFLOAD_SCRIPT = "acquisition_offload.sh"
+REQUIRED_ARGS = (
+    "optimizer",
+    "model_snapshot",
+    "data_snapshot",
+    "num_trials",
+    "output_path",
+)
 
 
 def run_acquisition_job(optimizer: str,
@@ -38,11 +44,14 @@ def run_acquisition_job(optimizer: str,
     """
     match optimizer:
         case "AxBackend":
+            # Imported lazily: backend imports are heavy
+            from flowboost.optimizer.interfaces.Ax import AxBackend
+
             backend = AxBackend
         case _:
             raise ValueError(f"Unknown optimizer backend: {optimizer}")
 
-    start = datetime.now(timezone.utc)
+    start_ns = time.perf_counter_ns()
     backend.offloaded_acquisition(
         model_snapshot=Path(model_snapshot),
         data_snapshot=Path(data_snapshot),
@@ -50,36 +59,58 @@ def run_acquisition_job(optimizer: str,
         output_path=Path(output_path)
     )
 
-    elapsed = td_format(start - datetime.now(timezone.utc))
+    elapsed = td_format((time.perf_counter_ns() - start_ns) / 1e9)
     logging.info(f"Finished acquisition job, took {elapsed}")
 
 
+def parse_args(argv: list[str]) -> dict[str, str]:
+    """
+    Parses `--key value` and `--key=value` argument pairs. A minimal
+    replacement for argparse, as the job is short-lived and its arguments
+    are always provided by the offload shell script.
+
+    Args:
+        argv (list[str]): Arguments, excluding the program name
+
+    Raises:
+        ValueError: If an argument is malformed or missing its value, or a \
+            required argument is missing
+
+    Returns:
+        dict[str, str]: Argument values keyed by argument names
+    """
+    args = {}
+    argv_iter = iter(argv)
+    for arg in argv_iter:
+        if not arg.startswith("--"):
+            raise ValueError(f"Unexpected argument: '{arg}'")
+
+        key, sep, value = arg[2:].partition("=")
+        if not sep:
+            value = next(argv_iter, None)
+            if value is None or value.startswith("--"):
+                raise ValueError(f"Argument '--{key}' expected a value")
+
+        args[key] = value
+
+    missing = [k for k in REQUIRED_ARGS if not args.get(k)]
+    if missing:
+        raise ValueError(f"Missing required argument(s): {', '.join(missing)}")
+
+    return args
+
+
 if __name__ == "__main__":
     logging.basicConfig(filename="external_acquisition.log",
                         filemode="a",
                         format="%(asctime)s - %(levelname)s - %(message)s",
                         level=logging.INFO)
 
-    parser = argparse.ArgumentParser(
-        description="Invoke offloaded acquisition method on a cluster.")
-
-    parser.add_argument("--optimizer", type=str, required=True,
-                        help="Name of backend class to use (e.g. AxBackend)")
-    parser.add_argument("--model_snapshot", type=str, required=True,
-                        help="Path to the model snapshot file")
-    parser.add_argument("--data_snapshot", type=str, required=True,
-                        help="Path to the data snapshot file")
-    parser.add_argument("--num_trials", type=int, required=True,
-                        help="Number of new trials to generate")
-    parser.add_argument("--output_path", type=str, required=True,
-                        help="Path to save the generated trials")
-
-    # Parse the arguments
-    args = parser.parse_args()
+    args = parse_args(sys.argv[1:])
 
     # Invoke the method with provided arguments
-    run_acquisition_job(optimizer=args.optimizer,
-                        model_snapshot=args.model_snapshot,
-                        data_snapshot=args.data_snapshot,
-                        num_trials=args.num_trials,
-                        output_path=args.output_path)
+    run_acquisition_job(optimizer=args["optimizer"],
+                        model_snapshot=args["model_snapshot"],
+                        data_snapshot=args["data_snapshot"],
+                        num_trials=int(args["num_trials"]),
+                        output_path=args["output_path"])
@@ -1,9 +1,10 @@
 import json
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Callable, Union
 
 from flowboost.openfoam.case import Case
 from flowboost.optimizer.objectives import AggregateObjective, Objective
@@ -13,12 +14,31 @@ DEFAULT_OFFLOAD_RESULT_FNAME = "acquisition_result.json"
 
 
 class Backend(ABC):
+    __slots__ = (
+        "type",
+        "objectives",
+        "dimensions",
+        "offload_acquisition",
+        "_objective_by_name",
+        "_dim_by_name",
+        "parallel_objectives",
+    )
+
     def __init__(self) -> None:
         self.type: str = self.__class__.__name__
         self.objectives: list[Union[Objective, AggregateObjective]] = []
         self.dimensions: list[Dimension] = []
         self.offload_acquisition: bool = False
 
+        # Name-keyed lookups for objectives and dimensions. Rebuilt by
+        # _cache_lookups() whenever objectives or the search space are set.
+        self._objective_by_name: dict[str, Union[Objective, AggregateObjective]] = {}
+        self._dim_by_name: dict[str, Dimension] = {}
+
+        # Evaluate and post-process objectives concurrently in batch_process.
+        # Only worthwhile for independent, I/O-bound objective functions.
+        self.parallel_objectives: bool = False
+
     @staticmethod
     def create(backend: str) -> "Backend":
         from flowboost.optimizer.interfaces.Ax import AxBackend
@@ -145,26 +165,33 @@ class Backend(ABC):
         # Save a state snapshot
         model_snapshot = self.produce_state_snapshot(save_in)
 
-        # Ensure case names are unique
-        if len(set([c.name for c in finished_cases])) != len(finished_cases):
-            raise ValueError("All case names must be unique: cannot proceed")
+        # Parametrizing a case reads every linked dictionary entry: do it
+        # only once per case, even if a case is both finished and pending.
+        parametrizations: dict[str, dict[str, Any]] = {}
+
+        def parametrize(c: Case) -> dict[str, Any]:
+            if c.name not in parametrizations:
+                parametrizations[c.name] = c.parametrize_configuration(self.dimensions)
+            return parametrizations[c.name]
+
+        # Construct one dictionary, keyed by names (Case isn't serializable).
+        # Case names must be unique: this is checked while building the dict.
+        finished: dict[str, dict] = {}
+        for c in finished_cases:
+            if c.name in finished:
+                raise ValueError("All case names must be unique: cannot proceed")
+
+            finished[c.name] = {
+                "parametrization": parametrize(c),
+                "objectives": c.objective_function_outputs(self.objectives),
+            }
 
-        # Construct one dictionary, keyed by names (Case isn't serializable)
         serializable = {
             "optimizer": self.__class__.__name__,
             "created_at": datetime.now(tz=timezone.utc).isoformat(),
-            "finished_cases": {
-                c.name: {
-                    "parametrization": c.parametrize_configuration(self.dimensions),
-                    "objectives": c.objective_function_outputs(self.objectives),
-                }
-                for c in finished_cases
-            },
+            "finished_cases": finished,
             "pending_cases": {
-                c.name: {
-                    "parametrization": c.parametrize_configuration(self.dimensions)
-                }
-                for c in pending_cases
+                c.name: {"parametrization": parametrize(c)} for c in pending_cases
             },
         }
 
@@ -192,49 +219,54 @@ class Backend(ABC):
         batch processing and aggregation, and return a list of lists of floats
         suitable for optimization.
         """
-        all_objective_outputs = []
 
-        # Step 1: Evaluate the objective functions
-        for objective in self.objectives:
+        def evaluate(objective: Union[Objective, AggregateObjective]) -> list:
             logging.info(f"Processing objective '{objective.name}'")
-            objective_outputs = objective.batch_evaluate(cases, save_values=False)
-            all_objective_outputs.append(objective_outputs)
+            return objective.batch_evaluate(cases, save_values=False)
+
+        # Step 1: Evaluate the objective functions
+        all_objective_outputs = self._map_objectives(evaluate, self.objectives)
 
         # Step 2: Ensure that no cases were marked as failed: if they did, remove them
         # Remove None values from all_objective_outputs
-        successful_cases_indices = [i for i, case in enumerate(cases) if case.success]
+        successful_cases = [case for case in cases if case.success]
         all_objective_outputs = [
-            [
-                output
-                for i, output in enumerate(objective_outputs)
-                if i in successful_cases_indices
-            ]
+            [output for output, case in zip(objective_outputs, cases) if case.success]
             for objective_outputs in all_objective_outputs
         ]
 
         # Update logging to reflect the removal of failed cases
         logging.info(
-            f"Removed failed cases: proceeding with {len(successful_cases_indices)} successful case(s)"
+            f"Removed failed cases: proceeding with {len(successful_cases)} successful case(s)"
         )
 
-        if len(successful_cases_indices) == 0:
+        if len(successful_cases) == 0:
             return []
 
         # Step 3: Execute post-processing steps for only successful cases
-        final_outputs = []
-        for i, objective in enumerate(self.objectives):
+        def post_process(
+            objective: Union[Objective, AggregateObjective], successful_outputs: list
+        ):
             logging.info(f"Post-processing objective '{objective.name}' outputs.")
-            # Filter cases and their outputs for successful cases only
-            successful_cases = [cases[i] for i in successful_cases_indices]
-            successful_outputs = all_objective_outputs[i]
-
-            # Execute post-processing
-            post_processed_outputs = objective.batch_post_process(
+            return objective.batch_post_process(
                 successful_cases, successful_outputs, save_values=True
             )
-            final_outputs.append(post_processed_outputs)
 
-        return final_outputs
+        return self._map_objectives(
+            post_process, self.objectives, all_objective_outputs
+        )
+
+    def _map_objectives(self, func: Callable, *iterables) -> list:
+        """
+        Map a function over per-objective arguments, either serially or in a
+        thread pool if `Backend.parallel_objectives` is set. Output order
+        always matches the order of `Backend.objectives`.
+        """
+        if not self.parallel_objectives or len(self.objectives) < 2:
+            return list(map(func, *iterables))
+
+        with ThreadPoolExecutor(max_workers=len(self.objectives)) as executor:
+            return list(executor.map(func, *iterables))
 
     def _objective_name_to_objective(
         self, objective_name: str
@@ -250,24 +282,45 @@ class Backend(ABC):
         Returns:
             Union[Objective, AggregateObjective]: An Objective
         """
-        for objective in self.objectives:
-            if objective.name == objective_name:
-                return objective
-
-        raise ValueError(f"Requested objective '{objective_name}' not found in backend")
+        try:
+            return self._objective_by_name[objective_name]
+        except KeyError:
+            raise ValueError(
+                f"Requested objective '{objective_name}' not found in backend"
+            ) from None
 
     def _dim_name_to_dimension(self, dim_name: str) -> Dimension:
-        for dim in self.dimensions:
-            if dim.name == dim_name:
-                return dim
-
-        raise ValueError(f"Requested dimension '{dim_name}' not found in backend")
+        try:
+            return self._dim_by_name[dim_name]
+        except KeyError:
+            raise ValueError(
+                f"Requested dimension '{dim_name}' not found in backend"
+            ) from None
+
+    def _cache_lookups(self):
+        """
+        Rebuild the name-keyed objective and dimension lookups. Should be
+        called by implementations of `set_objectives` and `set_search_space`.
+        """
+        self._objective_by_name = {o.name: o for o in self.objectives}
+        self._dim_by_name = {d.name: d for d in self.dimensions}
 
     def _objective_names_are_unique(self) -> bool:
-        return len(set([o.name for o in self.objectives])) == len(self.objectives)
+        return self._names_are_unique(self.objectives)
 
     def _dim_names_are_unique(self) -> bool:
-        return len(set([o.name for o in self.dimensions])) == len(self.dimensions)
+        return self._names_are_unique(self.dimensions)
+
+    @staticmethod
+    def _names_are_unique(items: list) -> bool:
+        # Single pass, returning on the first duplicate name
+        seen = set()
+        for item in items:
+            if item.name in seen:
+                return False
+            seen.add(item.name)
+
+        return True
 
     def _verify_configuration(self):
         """Verify a few key-parts of the backend configuration.
@@ -1,20 +1,44 @@
-import json
 import logging
 import sys
+import weakref
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional, Union
-
-from ax import Trial
-from ax.service.ax_client import AxClient, ObjectiveProperties, TParameterization
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from flowboost.openfoam.case import Case
 from flowboost.optimizer.backend import Backend
 from flowboost.optimizer.objectives import AggregateObjective, Objective
 from flowboost.optimizer.search_space import Dimension
+from flowboost.utilities import serialization
+
+# Ax pulls in torch and BoTorch: defer the imports until they are needed
+if TYPE_CHECKING:
+    from ax import Trial
+    from ax.service.ax_client import AxClient, TParameterization
 
 
 class AxBackend(Backend):
+    __slots__ = (
+        "client",
+        "stateless",
+        "incremental",
+        "_initialized",
+        "_config_validated",
+        "use_GPU",
+        "SAASBO",
+        "max_parallelism",
+        "initialization_trials",
+        "_parameter_constraints",
+        "_outcome_constraints",
+        "_ax_search_space_cache",
+        "_ax_objectives_cache",
+        "_SEM_by_objective",
+        "_trial_index_case_mapping",
+        "_trial_index_by_case_name",
+        "_parametrization_by_trial_index",
+        "_told_case_ids",
+    )
+
     def __init__(self, stateless: bool = True):
         """Craete an Ax client for Bayesian optimization.
 
@@ -24,10 +48,20 @@ class AxBackend(Backend):
         # Inherit main properties from Backend ABC
         super().__init__()
 
+        from ax.service.ax_client import AxClient
+
         # Main Ax state
-        self.client: AxClient = AxClient()
+        self.client: "AxClient" = AxClient()
         self.stateless: bool = stateless
 
+        # Keep the client between tell() calls, only attaching new trials,
+        # instead of re-initializing it with the full history every time
+        self.incremental: bool = False
+        self._initialized: bool = False
+
+        # Objectives and search space verified, reset by set_* methods
+        self._config_validated: bool = False
+
         # Ax-specific options
         self.use_GPU: bool = True
         self.SAASBO: bool = False
@@ -38,20 +72,51 @@ class AxBackend(Backend):
         self._parameter_constraints: list[str] = []
         self._outcome_constraints: list[str] = []
 
+        # Ax parameter dicts built from dimensions, reset by set_search_space
+        self._ax_search_space_cache: Optional[list[dict[str, Any]]] = None
+
+        # Ax objective properties built from objectives, reset by set_objectives
+        self._ax_objectives_cache: Optional[dict[str, Any]] = None
+
         # Ax-specific features for noise
         self._SEM_by_objective: dict[str, Optional[float]] = {}
-        self._trial_index_case_mapping: dict[Case, int] = {}
+
+        # Case does not override __hash__/__eq__, so cases are keyed by identity.
+        # Weak keys: Case objects from earlier optimizer loops are not pinned.
+        self._trial_index_case_mapping: weakref.WeakKeyDictionary[Case, int] = (
+            weakref.WeakKeyDictionary()
+        )
+
+        # Case objects are re-created between optimizer loops: track by name
+        self._trial_index_by_case_name: dict[str, int] = {}
+
+        # Parametrizations passed to Ax when attaching cases
+        self._parametrization_by_trial_index: dict[int, dict[str, Any]] = {}
+
+        # Cases whose results the model already holds (incremental mode)
+        self._told_case_ids: set[str] = set()
 
     def initialize(self):
         if not self.stateless:
             raise NotImplementedError("Stateful optimizer checkpoints not implemented")
 
-        # Check objectives + dimensions
-        self._verify_configuration()
+        # Check objectives + dimensions, unless unchanged since the last check
+        if not self._config_validated:
+            self._verify_configuration()
+            self._config_validated = True
+
+        from ax.service.ax_client import AxClient
+
+        # Create a stateless optimizer client, on the device set by use_GPU
+        self.client = AxClient(torch_device=self._get_torch_device())
+        self._trial_index_case_mapping = weakref.WeakKeyDictionary()
+        self._trial_index_by_case_name = {}
+        self._parametrization_by_trial_index = {}
+        self._told_case_ids = set()
 
-        # Create a stateless optimizer client
         self.client.create_experiment(
-            parameters=self._get_ax_search_space(),
+            # Ax may modify the parameter dicts in-place: pass copies
+            parameters=[dict(p) for p in self._get_ax_search_space()],
             objectives=self._get_ax_objectives(),
             parameter_constraints=self._parameter_constraints,
             outcome_constraints=self._outcome_constraints,
@@ -63,8 +128,25 @@ class AxBackend(Backend):
             },
         )
 
+        self._initialized = True
         logging.info("Ax experiment initialized")
 
+    def _get_torch_device(self):
+        """
+        Get the device for BoTorch models: a CUDA device if use_GPU is set and
+        one is available, otherwise None (Ax's default, CPU).
+        """
+        if not self.use_GPU:
+            return None
+
+        import torch
+
+        if not torch.cuda.is_available():
+            logging.debug("use_GPU set, but CUDA not available: running on CPU")
+            return None
+
+        return torch.device("cuda")
+
     def produce_state_snapshot(self, save_in: Path) -> Path:
         """
         Produces a JSON file of the client's settings and state, so that it
@@ -108,8 +190,7 @@ class AxBackend(Backend):
         ax = cls.restore_from_state_snapshot(model_snapshot)
 
         # Restore data
-        with open(data_snapshot, "r") as json_f:
-            data = json.load(json_f)
+        data = serialization.load(data_snapshot)
 
         # Ensure backend types match in data snapshot
         if data["optimizer"] != ax.type:
@@ -122,9 +203,7 @@ class AxBackend(Backend):
         # Attach finished trials to backend
         logging.info("Attaching finished trials")
         for case_name, data_dict in data["finished_cases"].items():
-            _, idx = ax.client.attach_trial(
-                parameters=data_dict["parametrization"], arm_name=case_name
-            )
+            idx = ax._attach_trial(data_dict["parametrization"], case_name)
 
             # TODO support user's noise preference!
             raw_data = {
@@ -137,9 +216,11 @@ class AxBackend(Backend):
         # Attach pending trials to backend
         logging.info("Attaching pending trials")
         for case_name, data_dict in data["pending_cases"].items():
-            _, idx = ax.client.attach_trial(
-                parameters=data_dict["parametrization"], arm_name=case_name
-            )
+            ax._attach_trial(data_dict["parametrization"], case_name)
+
+        # The trials now live in the client: release the parsed snapshot
+        # before model fitting, which is where peak memory usage occurs
+        del data
 
         # Run acquisition
         logging.info("Data loaded: running model update + acquisition")
@@ -153,15 +234,15 @@ class AxBackend(Backend):
 
         logging.info(f"Received {len(new_parametrizations)} new trial(s) from Ax")
 
-        snapshot = {
+        header = {
             "optimizer": ax.type,
             "created_at": datetime.now(tz=timezone.utc).isoformat(),
             "status_finished": finished,
-            "parametrizations": new_parametrizations,
         }
 
-        with open(output_path, "w") as json_f:
-            json.dump(snapshot, json_f)
+        serialization.dump_streaming(
+            header, "parametrizations", new_parametrizations.items(), output_path
+        )
 
         logging.info(f"Wrote acquisition snapshot to file [{output_path}]")
 
@@ -183,9 +264,8 @@ class AxBackend(Backend):
         if not from_file.exists():
             raise FileNotFoundError(f"Ax snapshot file not found: {from_file}")
 
-        with open(from_file, "r") as json_f:
-            json_d = json.load(json_f)
-            ax.client.from_json_snapshot(json_d)
+        # from_json_snapshot is a classmethod: it returns the restored client
+        ax.client = ax.client.from_json_snapshot(serialization.load(from_file))
 
         logging.info("Restored Ax state from json snapshot")
         return ax
@@ -199,19 +279,24 @@ class AxBackend(Backend):
         """
         if not self.stateless:
             raise ValueError("Re-initialize should not be called when stateless=False")
-        self.client = AxClient()
         self.initialize()
 
     def set_objectives(self, objectives: list[Union[Objective, AggregateObjective]]):
         if isinstance(objectives, (Objective, AggregateObjective)):
             objectives = [objectives]
         self.objectives = objectives
+        self._ax_objectives_cache = None
+        self._config_validated = False
+        self._cache_lookups()
 
     def set_search_space(self, dimensions: list[Dimension]):
         if isinstance(dimensions, Dimension):
             dimensions = [dimensions]
 
         self.dimensions = dimensions
+        self._ax_search_space_cache = None
+        self._config_validated = False
+        self._cache_lookups()
 
     def set_parameter_constraints(self, constraints: list[str]):
         """Allows setting parameter constraints using string-based mathematical
@@ -254,18 +339,13 @@ class AxBackend(Backend):
 
             https://ax.dev/api/core.html#ax.core.base_trial.TrialStatus
             """
-            if case not in self._trial_index_case_mapping:
-                raise ValueError(
-                    f"Case not in trial mapping, cannot mark failed [{case}]"
-                )
-
-            trial_idx = self._trial_index_case_mapping[case]
+            trial_idx = self._get_trial_idx(case, "cannot mark failed")
             trial = self.client.get_trial(trial_idx)
 
             if not self._can_abandon_trial(trial):
                 continue
 
-            logging.info(f"Marking as abandoned: {case}")
+            logging.info("Marking as abandoned: %s", case)
             self.client.abandon_trial(trial_idx)
 
     def tell_and_ask(
@@ -287,7 +367,7 @@ class AxBackend(Backend):
         self.tell(cases)
         return self.ask(max_cases=max_cases)
 
-    def _ask(self, max_cases: int) -> dict[int, TParameterization]:
+    def _ask(self, max_cases: int) -> dict[int, "TParameterization"]:
         new_parametrizations, finished = self.client.get_next_trials(
             max_trials=max_cases
         )
@@ -319,54 +399,88 @@ class AxBackend(Backend):
             cases (list[Case]): List of evaluated cases
         """
         if self.stateless:
-            self._re_initialize_client()
+            if not (self.incremental and self._initialized):
+                self._re_initialize_client()
         else:
             raise NotImplementedError("Stateful tell() not implemented")
 
         # TODO handle failure criteria here
 
+        logging.debug("Ax search space: %s", self._get_ax_search_space())
+
+        # Ensure all cases have been attached as trials to Ax
+        self._ensure_attached(cases)
+
+        if self.incremental:
+            # Cases told in a previous loop are already in the model
+            skipped = [c for c in cases if c.id in self._told_case_ids]
+            if skipped:
+                logging.warning(
+                    f"Skipping {len(skipped)} case(s) already told to the model: "
+                    f"{[c.name for c in skipped]}"
+                )
+                cases = [c for c in cases if c.id not in self._told_case_ids]
+
         # Next, get the objective function outputs for each case
         logging.info("Retrieving objective function outputs")
         case_objective_outputs: dict[Case, dict] = {
             c: c.objective_function_outputs(self.objectives) for c in cases
         }
 
-        logging.info(f"Ax search space: {self._get_ax_search_space()}")
-
-        # Ensure all cases have been attached as trials to Ax
-        self._ensure_attached(cases)
-
         # Complete case trials
         self._complete_trials(cases, case_objective_outputs)
+        self._told_case_ids.update(c.id for c in cases)
 
     def get_model_prediction(self, case: Case):
-        if case not in self._trial_index_case_mapping:
-            return None
+        return self.get_model_predictions([case])[0]
 
-        parametrization = self.client.get_trial_parameters(
-            trial_index=self._trial_index_case_mapping[case]
-        )
+    def get_model_predictions(self, cases: list[Case]) -> list[Optional[dict]]:
+        """
+        Get the model's predictions for a list of attached cases. All
+        predictions are computed with a single call to Ax.
 
-        # Get model's predictions for this parameterization
-        logging.info("Getting model predictions for parameterization")
+        Args:
+            cases (list[Case]): Cases to get predictions for
+
+        Returns:
+            list[Optional[dict]]: Predictions, in the order of `cases`. None \
+                for cases that have not been attached, or if no predictions \
+                are available.
+        """
+        trial_idxs = [self._trial_index_case_mapping.get(case) for case in cases]
+        parametrizations = [
+            self._get_trial_parametrization(idx)
+            for idx in trial_idxs
+            if idx is not None
+        ]
+
+        if not parametrizations:
+            return [None] * len(cases)
+
+        # Get model's predictions for the parameterizations
+        logging.info(
+            f"Getting model predictions for {len(parametrizations)} parameterization(s)"
+        )
 
         try:
-            prediction = self.client.get_model_predictions_for_parameterizations(
-                parameterizations=[parametrization]
-            )[0]
+            predictions = iter(
+                self.client.get_model_predictions_for_parameterizations(
+                    parameterizations=parametrizations
+                )
+            )
         except NotImplementedError:
             # Predictions are not implemented for Sobol generation phase: OK
-            return None
+            return [None] * len(cases)
         except Exception:
             logging.exception(
-                f"Could not get model predictions for parameterization={parametrization}"
+                f"Could not get model predictions for parameterizations={parametrizations}"
             )
-            return None
+            return [None] * len(cases)
 
-        return prediction
+        return [None if idx is None else next(predictions) for idx in trial_idxs]
 
     def _post_process_suggestion_parametrizations(
-        self, parametrizations: dict[int, TParameterization]
+        self, parametrizations: dict[int, "TParameterization"]
     ) -> list[dict[Dimension, Any]]:
         """
         Converts the list of string-keyed dictionaries, mapping search space
@@ -380,18 +494,13 @@ class AxBackend(Backend):
             list[dict[Dimension, Any]]: Dimension-keyed list of \
                 parametrizations.
         """
-        processed = []
+        to_dimension = self._dim_name_to_dimension
 
         # For each parametrization, convert the str-keys to be Dimensions
-        for trial_index, parametrization in parametrizations.items():
-            new_suggestion = {}
-            for str_key, val in parametrization.items():
-                dim = self._dim_name_to_dimension(str_key)
-                new_suggestion[dim] = val
-
-            processed.append(new_suggestion)
-
-        return processed
+        return [
+            {to_dimension(str_key): val for str_key, val in parametrization.items()}
+            for parametrization in parametrizations.values()
+        ]
 
     def _ensure_attached(self, cases: list[Case]):
         """
@@ -409,19 +518,70 @@ class AxBackend(Backend):
         """
         for case in cases:
             if case in self._trial_index_case_mapping:
-                logging.info(f"Case already attached in _ensure_attached, {case}")
+                logging.info("Case already attached in _ensure_attached, %s", case)
+                continue
+
+            if case.name in self._trial_index_by_case_name:
+                # Attached in a previous loop (incremental mode)
+                idx = self._trial_index_by_case_name[case.name]
+                self._trial_index_case_mapping[case] = idx
                 continue
 
             # Generate parametrizations: these describe the search space for Ax
             p = case.parametrize_configuration(self.dimensions)
 
-            logging.info(f"Attaching c={case.name}, p={p}")
-            _, idx = self.client.attach_trial(parameters=p, arm_name=case.name)
+            logging.info("Attaching c=%s", case.name)
+            logging.debug("Parametrization for c=%s: p=%s", case.name, p)
+            idx = self._attach_trial(p, case.name)
 
-            # TODO if we were to run in stateful mode, we'd stash the index
             self._trial_index_case_mapping[case] = idx
+            self._trial_index_by_case_name[case.name] = idx
+            self._parametrization_by_trial_index[idx] = p
+
+    def _attach_trial(self, parametrization: dict[str, Any], name: str) -> int:
+        """
+        Attach a new trial, returning its index. Cases never share a trial:
+        Ax requires trials with identical parametrizations (e.g. retries) to \
+        share an arm, so the experiment's existing arm name is re-used.
+        """
+        from ax.core.arm import Arm
+
+        arm = self.client.experiment.arms_by_signature.get(
+            Arm(parameters=parametrization).signature
+        )
+        arm_name = arm.name if arm is not None else name
+        _, idx = self.client.attach_trial(parameters=parametrization, arm_name=arm_name)
+        return idx
+
+    def _get_trial_parametrization(self, trial_idx: int) -> dict[str, Any]:
+        if trial_idx in self._parametrization_by_trial_index:
+            return self._parametrization_by_trial_index[trial_idx]
+
+        # Not attached through _ensure_attached: ask Ax
+        return self.client.get_trial_parameters(trial_index=trial_idx)
+
+    def _get_trial_idx(self, case: Case, action: str) -> int:
+        """
+        Look up the Ax trial index of an attached case.
+
+        Args:
+            case (Case): Attached case
+            action (str): Description of the action, used in the error message
+
+        Raises:
+            ValueError: If the case has not been attached
+
+        Returns:
+            int: Trial index
+        """
+        try:
+            return self._trial_index_case_mapping[case]
+        except KeyError:
+            raise ValueError(
+                f"Case not in trial index mapping, {action} [{case}]"
+            ) from None
 
-    def _can_abandon_trial(self, trial: Trial) -> bool:
+    def _can_abandon_trial(self, trial: "Trial") -> bool:
         if trial is None:
             return False
 
@@ -433,7 +593,7 @@ class AxBackend(Backend):
             or trial.status.is_completed
         ):
             logging.warning(
-                f"Trial {trial} is already terminal/abandoned/failed/completed"
+                "Trial %s is already terminal/abandoned/failed/completed", trial
             )
             return False
 
@@ -443,51 +603,61 @@ class AxBackend(Backend):
         self, cases: list[Case], objective_f_outputs: dict[Case, dict]
     ):
         for case in cases:
-            if case not in self._trial_index_case_mapping:
-                raise ValueError(
-                    f"Case not in trial index mapping, cannot complete trial [{case}]"
-                )
-
+            trial_idx = self._get_trial_idx(case, "cannot complete trial")
             # Construct tuple-based result for case: see Ax TEvaluationOutcome
             raw_data = {
                 obj_name: (outcome, self._SEM_by_objective.get(obj_name, 0.0))
                 for obj_name, outcome in objective_f_outputs[case].items()
             }
+            self.client.complete_trial(trial_index=trial_idx, raw_data=raw_data)  # type: ignore
 
-            self.client.complete_trial(
-                trial_index=self._trial_index_case_mapping[case],
-                raw_data=raw_data,  # type: ignore
-            )
+    def _get_ax_objectives(self) -> dict[str, Any]:
+        if self._ax_objectives_cache is None:
+            from ax.service.ax_client import ObjectiveProperties
 
-    def _get_ax_objectives(self):
-        ax_objectives = {}
-        for objective in self.objectives:
-            ax_objectives[objective.name] = ObjectiveProperties(
-                minimize=objective.minimize, threshold=objective.threshold
-            )
+            self._ax_objectives_cache = {
+                o.name: ObjectiveProperties(minimize=o.minimize, threshold=o.threshold)
+                for o in self.objectives
+            }
 
-        return ax_objectives
+        return self._ax_objectives_cache
 
     def _dim_to_Ax_parameter_dict(self, dim: Dimension):
+        try:
+            build_type_fields = _AX_PARAMETER_BUILDERS[dim.type]
+        except KeyError:
+            raise ValueError(f"Dimension type '{dim.type} not supported'") from None
+
         d = {"name": dim.name, "type": dim.type, "value_type": dim.value_type}
+        d.update(build_type_fields(dim))
+        return d
 
-        match dim.type:
-            case "range":
-                d["bounds"] = dim.bounds
-                d["log_scale"] = dim.log_scale
-                d["digits"] = dim.digits
-            case "choice":
-                d["values"] = dim.values
-                d["is_ordered"] = dim.is_ordered
-            case "fixed":
-                if not dim.values:
-                    raise ValueError("Fixed dimension must have a specified value")
-
-                d["value"] = dim.values[0]
-            case _:
-                raise ValueError(f"Dimension type '{dim.type} not supported'")
+    def _get_ax_search_space(self) -> list[dict[str, Any]]:
+        if self._ax_search_space_cache is None:
+            self._ax_search_space_cache = [
+                self._dim_to_Ax_parameter_dict(d) for d in self.dimensions
+            ]
+        return self._ax_search_space_cache
+
+
+def _range_parameter_fields(dim: Dimension) -> dict[str, Any]:
+    return {"bounds": dim.bounds, "log_scale": dim.log_scale, "digits": dim.digits}
+
+
+def _choice_parameter_fields(dim: Dimension) -> dict[str, Any]:
+    return {"values": dim.values, "is_ordered": dim.is_ordered}
+
+
+def _fixed_parameter_fields(dim: Dimension) -> dict[str, Any]:
+    if not dim.values:
+        raise ValueError("Fixed dimension must have a specified value")
+
+    return {"value": dim.values[0]}
 
-        return d
 
-    def _get_ax_search_space(self):
-        return [self._dim_to_Ax_parameter_dict(d) for d in self.dimensions]
+# Type-specific fields of Ax parameter dicts, by dimension type
+_AX_PARAMETER_BUILDERS = {
+    "range": _range_parameter_fields,
+    "choice": _choice_parameter_fields,
+    "fixed": _fixed_parameter_fields,
+}
@@ -1,12 +1,20 @@
 import logging
-from typing import Any, Callable, Literal, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Literal, Optional, Union
 from uuid import uuid4
 
 import numpy as np
-from sklearn.preprocessing import MinMaxScaler, PowerTransformer
+from joblib import Parallel, delayed
+from sklearn.preprocessing import PowerTransformer
 
+from flowboost.config import config
 from flowboost.openfoam.case import Case
 
+# Maximum number of objective function outputs cached per Objective
+_EVAL_CACHE_SIZE: int = 4096
+
 
 class Objective:
     def __init__(
@@ -67,6 +75,15 @@ class Objective:
         # objectives that are to be minimized.
         self.threshold: Optional[float] = threshold
 
+        # Opt-in cache of objective function outputs by case ID. Case objects
+        # are re-created on every optimizer loop, while their IDs (path
+        # hashes) are stable. A case re-run in place keeps its ID: enable only
+        # if case outputs do not change once evaluated.
+        # Cleared when the objective function or its kwargs are replaced.
+        self.cache_outputs: bool = False
+        self._eval_cache: OrderedDict[str, Any] = OrderedDict()
+        self._eval_cache_lock = threading.Lock()
+
         # User-provided function instance performing arbitrary computation
         # on a Pandas DataFrame, and returning some comparable result that
         # can be used during the optimization process.
@@ -96,11 +113,34 @@ class Objective:
         if normalization_step:
             self.add_normalization_step(method=normalization_step)
 
+    @property
+    def objective_function(self) -> Callable:
+        return self._objective_function
+
+    @objective_function.setter
+    def objective_function(self, objective_function: Callable):
+        self._objective_function = objective_function
+        self.clear_cache()
+
+    @property
+    def objective_function_kwargs(self) -> dict:
+        return self._objective_function_kwargs
+
+    @objective_function_kwargs.setter
+    def objective_function_kwargs(self, objective_function_kwargs: dict):
+        # NOTE: modifying the dictionary in place does not clear the cache
+        self._objective_function_kwargs = objective_function_kwargs
+        self.clear_cache()
+
     def add_normalization_step(
-        self, method: Literal["min-max", "yeo-johnson", "box-cox"]
+        self,
+        method: Literal["min-max", "yeo-johnson", "box-cox"],
+        refit_interval: int = 1,
     ):
         """Simple high-level method of integrating a normalization step to the
-        objective pipeline. The methods are from `sklearn.preprocessing`.
+        objective pipeline. The power transforms are from
+        `sklearn.preprocessing`; min-max scaling is an equivalent of its
+        `MinMaxScaler`, computed directly with NumPy.
 
         The normalization step is performed once all points in the dataset have
         been evaluated using this Objective function. The input is, thus, the
@@ -112,13 +152,15 @@ class Objective:
 
         Args:
             method (Literal): Normalization method to use: min-max or power-transform.
+            refit_interval (int, optional): Re-fit the normalizer only on \
+                every n-th post-processing pass. Defaults to 1.
 
         Raises:
             ValueError: If method is not implemented
         """
         match method.lower():
             case "min-max":
-                normalizer = MinMaxScaler()
+                normalizer = _MinMaxNormalizer()
             case "yeo-johnson":
                 normalizer = PowerTransformer(method="yeo-johnson")
             case "box-cox":
@@ -130,7 +172,7 @@ class Objective:
                 raise ValueError(f"Unsupported normalization method '{method}'")
 
         self.attach_post_processing_step(
-            step=ScikitNormalizationStep(normalizer).evaluate
+            step=ScikitNormalizationStep(normalizer, refit_interval).evaluate
         )
 
     def attach_post_processing_step(self, step: Callable, **kwargs: Optional[dict]):
@@ -144,47 +186,59 @@ class Objective:
             step (Callable): _description_
         """
         self._post_processing_steps.append((step, kwargs))
+        self.clear_cache()
 
     def execute_post_processing_steps(
         self, cases: list[Case], outputs: list[Any], save_output: bool = True
     ) -> dict[Case, Any]:
+        outputs = self._apply_post_processing_steps(cases, outputs)
+
+        # Optionally, save post-processed outputs back to a dictionary keyed by Case
+        # if specific per-case post-processed data is needed for further analysis
+        out_dict: dict[Case, Any] = dict(zip(cases, outputs))
+
+        if save_output:
+            self._post_processed_data = out_dict
+
+        return out_dict
+
+    def _apply_post_processing_steps(self, cases: list[Case], outputs: Any) -> Any:
         if len(outputs) != len(cases):
             raise ValueError(
                 f"Case count != output count: cases={cases}, outputs={outputs}"
             )
 
         if len(outputs) == 0:
-            return {}
+            return outputs
 
         # Iterate over post-processing steps
         for step, kwargs in self._post_processing_steps:
             # Apply the step to the entire array of outputs
-            # Consider using try-except to handle errors gracefully
             try:
                 outputs = step(outputs, **kwargs)
             except Exception as e:
                 raise ValueError(f"Error applying post-processing step {step}: {e}")
 
-        # Optionally, save post-processed outputs back to a dictionary keyed by Case
-        # if specific per-case post-processed data is needed for further analysis
-        out_dict: dict[Case, Any] = {}
-        for case, processed_output in zip(cases, outputs):
-            out_dict[case] = processed_output
-
-        if save_output:
-            self._post_processed_data = out_dict
-
-        return out_dict
+        return outputs
 
-    def evaluate(self, case: Case, save_value: bool = True) -> Optional[Any]:
+    def evaluate(
+        self, case: Case, save_value: bool = True, force: bool = False
+    ) -> Optional[Any]:
         """
         Evaluates the objective function for a case, returning the output
         value. If the objective function returns a None-type, the value is
         not saved to the objective to avoid post-processing failures.
 
+        If `cache_outputs` is enabled, outputs are cached by case ID: a case
+        is then only evaluated once, unless `force` is set or the cache is
+        cleared with `clear_cache()`. The cache is cleared when the objective
+        function, its kwargs, or the post-processing steps change.
+
         Args:
             case (Case): _description_
             save_value (bool, optional): _description_. Defaults to True.
+            force (bool, optional): Re-evaluate even if a cached output \
+                exists. Defaults to False.
 
         Returns:
             Any: Value of the objective function output for a successful case: \
@@ -194,10 +248,11 @@ class Objective:
             logging.warning("Case has been marked as failed: not evaluating objective")
             return None
 
-        if self.objective_function_kwargs:
-            out = self.objective_function(case, self.objective_function_kwargs)
-        else:
-            out = self.objective_function(case)
+        out = None if force else self._cached_output(case)
+        if out is None:
+            # kwargs are passed as one positional dict, and only when set
+            kwargs = self.objective_function_kwargs
+            out = self.objective_function(case, *((kwargs,) if kwargs else ()))
 
         if out is None:
             # Failures are not stored in the objective
@@ -206,11 +261,34 @@ class Objective:
             case.mark_failed()
             return None
 
+        if self.cache_outputs:
+            with self._eval_cache_lock:
+                self._eval_cache[case.id] = out
+                self._eval_cache.move_to_end(case.id)
+                if len(self._eval_cache) > _EVAL_CACHE_SIZE:
+                    self._eval_cache.popitem(last=False)
+
         if save_value:
             self._objective_output_data[case] = out
 
         return out
 
+    def clear_cache(self):
+        """Clear the cached objective function outputs."""
+        with self._eval_cache_lock:
+            self._eval_cache.clear()
+
+    def _cached_output(self, case: Case) -> Optional[Any]:
+        if not self.cache_outputs:
+            return None
+
+        with self._eval_cache_lock:
+            out = self._eval_cache.get(case.id)
+            if out is not None:
+                self._eval_cache.move_to_end(case.id)
+
+        return out
+
     def data_for_case(self, case: Case, post_processed: bool = True) -> Any:
         """Reads objective output for a Case, either from before or after
         the post-processing step.
@@ -230,18 +308,67 @@ class Objective:
         return self._objective_output_data.get(case, None)
 
     def batch_evaluate(
-        self, cases: list[Case], save_values: bool = False
+        self,
+        cases: list[Case],
+        save_values: bool = False,
+        n_jobs: Optional[int] = None,
+        force: bool = False,
     ) -> list[Optional[Any]]:
-        # Evaluate for each case
-        return [self.evaluate(case=case, save_value=save_values) for case in cases]
+        """
+        Evaluates the objective function for a list of cases. The cases are
+        evaluated concurrently in threads with joblib, which suits objective
+        functions bound by reading simulation output from disk.
+
+        Args:
+            cases (list[Case]): Cases to evaluate
+            save_values (bool, optional): Store outputs in the objective. \
+                Defaults to False.
+            n_jobs (Optional[int], optional): Number of concurrent evaluations, \
+                see `joblib.Parallel`. Defaults to None, which evaluates up to \
+                `config.MAX_IO_WORKERS` cases at a time. Pass 1 to evaluate \
+                serially, e.g. for objective functions that are not \
+                thread-safe.
+            force (bool, optional): Re-evaluate cases with cached outputs. \
+                Defaults to False.
+
+        Returns:
+            list[Optional[Any]]: Objective function outputs, in order of `cases`
+        """
+        # Cases with a cached output are not dispatched for evaluation
+        outputs: list[Optional[Any]] = [
+            None if force or case.success is False else self._cached_output(case)
+            for case in cases
+        ]
+        pending = [i for i, out in enumerate(outputs) if out is None]
+
+        if pending:
+            n_jobs = _batch_n_jobs(n_jobs, len(pending))
+            new_outputs = Parallel(n_jobs=n_jobs, prefer="threads")(
+                delayed(self.evaluate)(case=cases[i], save_value=False, force=force)
+                for i in pending
+            )
+            for i, out in zip(pending, new_outputs):
+                outputs[i] = out
+
+        if save_values:
+            for case, out in zip(cases, outputs):
+                if out is not None:
+                    self._objective_output_data[case] = out
+
+        return outputs
 
     def batch_post_process(
         self, cases: list[Case], outputs: list[Any], save_values: bool = True
     ) -> list[float]:
-        out_d = self.execute_post_processing_steps(
-            cases=cases, outputs=outputs, save_output=save_values
-        )
-        return list(out_d.values())
+        if save_values:
+            out_d = self.execute_post_processing_steps(
+                cases=cases, outputs=outputs, save_output=True
+            )
+            return list(out_d.values())
+
+        # No per-case dictionary is needed when the outputs are not stored
+        outputs = self._apply_post_processing_steps(cases, outputs)
+        return outputs.tolist() if isinstance(outputs, np.ndarray) else list(outputs)
 
 
 class AggregateObjective:
@@ -283,6 +410,16 @@ class AggregateObjective:
         )
         self.threshold: Optional[float] = threshold
 
+        # Weights as an array for the vectorized aggregation step. The array
+        # is read-only, as it is shared across all aggregation calls.
+        self._weights_array = np.asarray(self.weights, dtype=np.float64)
+        self._weights_array.setflags(write=False)
+
+        # Evaluate the wrapped objectives for a case concurrently. Only
+        # worthwhile for independent, I/O-bound objective functions.
+        self.parallel_objectives: bool = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+
         self._post_processing_steps: list[tuple[Callable, dict[str, Any]]] = []
 
         # Data storage for each case that gets evaluated by this objective
@@ -307,54 +444,105 @@ class AggregateObjective:
         self._post_processing_steps.append((step, kwargs))
 
     def evaluate(self, case: Case) -> tuple:
-        objective_outputs = [
-            obj.evaluate(case, save_value=False) for obj in self.objectives
-        ]
+        if self.parallel_objectives and len(self.objectives) > 1:
+            if self._executor is None:
+                # Shared across calls, so threads are not re-spawned per case
+                self._executor = ThreadPoolExecutor(max_workers=len(self.objectives))
+
+            futures = [
+                self._executor.submit(obj.evaluate, case, save_value=False)
+                for obj in self.objectives
+            ]
+            objective_outputs = [f.result() for f in futures]
+        else:
+            objective_outputs = [
+                obj.evaluate(case, save_value=False) for obj in self.objectives
+            ]
 
         self._objective_output_data[case] = objective_outputs
         return tuple(objective_outputs)
 
-    def _evaluate_batch(self, cases: list[Case]) -> list[tuple]:
-        all_outputs = [self.evaluate(case) for case in cases]
-        return all_outputs
+    def _evaluate_batch(
+        self, cases: list[Case], n_jobs: Optional[int] = None
+    ) -> np.ndarray:
+        # Outputs are written straight into an (N cases, K objectives) buffer
+        # as they are produced. Failed evaluations (None) are stored as NaN.
+        outputs = np.empty((len(cases), len(self.objectives)), dtype=np.float64)
+        n_jobs = _batch_n_jobs(n_jobs, len(cases))
+        results = Parallel(n_jobs=n_jobs, prefer="threads", return_as="generator")(
+            delayed(self.evaluate)(case) for case in cases
+        )
+        for i, case_outputs in enumerate(results):
+            outputs[i] = case_outputs
+
+        return outputs
+
+    def apply_batch_post_processing(
+        self, all_outputs: Union[np.ndarray, list[tuple]]
+    ) -> np.ndarray:
+        """Apply the post-processing steps to the outputs of a batch of cases,
+        e.g. normalization across each element of the tuples. Each step is
+        applied to one objective's outputs (column) at a time.
+
+        Args:
+            all_outputs (Union[np.ndarray, list[tuple]]): Outputs of the \
+                wrapped objectives, one tuple (row) per case.
+
+        Returns:
+            np.ndarray: A new (N cases, K objectives) float array of the \
+                post-processed outputs. The input is not modified.
+        """
+        outputs = np.array(all_outputs, dtype=np.float64).reshape(
+            len(all_outputs), len(self.objectives)
+        )
+
+        if outputs.size == 0:
+            return outputs
 
-    def apply_batch_post_processing(self, all_outputs: list[tuple]) -> list[tuple]:
-        # Apply post-processing steps suitable for batch-level processing
-        # Example: normalization across each element of the tuples
         for step, kwargs in self._post_processing_steps:
             try:
-                all_outputs = [step(output, **kwargs) for output in zip(*all_outputs)]
-                # Transpose back if needed
-                all_outputs = list(zip(*all_outputs))
+                for j in range(outputs.shape[1]):
+                    outputs[:, j] = np.asarray(step(outputs[:, j], **kwargs)).ravel()
             except Exception as e:
                 raise ValueError(
                     f"Error applying batch post-processing step {step}: {e}"
                 )
-        return all_outputs
+        return outputs
 
-    def aggregate_outputs(self, processed_outputs: list[tuple]) -> list[float]:
+    def aggregate_outputs(
+        self, processed_outputs: Union[np.ndarray, list[tuple]]
+    ) -> list[float]:
         """Aggregate the post-processed tuple outputs into scalar values."""
-        aggregated_values = [
-            sum(
-                float(output * weight)
-                for output, weight in zip(obj_outputs, self.weights)
-            )
-            for obj_outputs in processed_outputs
-        ]
-        return aggregated_values
+        outputs = np.asarray(processed_outputs, dtype=np.float64).reshape(
+            len(processed_outputs), len(self._weights_array)
+        )
+        return (outputs @ self._weights_array).tolist()
 
-    def batch_process(self, cases: list[Case], save_values: bool = True) -> list[float]:
+    def batch_process(
+        self, cases: list[Case], save_values: bool = True
+    ) -> list[Optional[float]]:
         # Step 1: Evaluate all objectives for all cases
         all_outputs = self._evaluate_batch(cases)
 
+        # Failed evaluations (NaN) are left out of post-processing, and no
+        # output is stored for them: their output is None
+        valid = ~np.isnan(all_outputs).any(axis=1)
+        if not valid.all():
+            logging.warning(
+                f"Objective '{self.name}': skipping {int((~valid).sum())} "
+                "case(s) with failed evaluations"
+            )
+
         # Step 2: Apply batch-level post-processing
-        processed_outputs = self.apply_batch_post_processing(all_outputs)
+        processed_outputs = self.apply_batch_post_processing(all_outputs[valid])
 
         # Step 3: Aggregate post-processed outputs into scalar values
-        outputs = self.aggregate_outputs(processed_outputs)
+        aggregated = iter(self.aggregate_outputs(processed_outputs))
+        outputs = [next(aggregated) if ok else None for ok in valid]
 
         for case, out in zip(cases, outputs):
-            self._post_processed_data[case] = out
+            if out is not None:
+                self._post_processed_data[case] = out
 
         return outputs
 
@@ -399,7 +587,7 @@ def objective_func_output(
         )
 
     if re_evaluate:
-        objective.evaluate(case)
+        objective.evaluate(case, force=True)
 
     return objective.data_for_case(case, post_processed=post_processed)
 
@@ -411,10 +599,87 @@ class ScikitNormalizationStep:
     steps.
     """
 
-    def __init__(self, scikit_normalizer) -> None:
+    def __init__(self, scikit_normalizer, refit_interval: int = 1) -> None:
+        """
+        Args:
+            scikit_normalizer: Scikit-learn transformer with `fit_transform`
+            refit_interval (int, optional): Re-fit the normalizer on every \
+                n-th evaluation, and only transform the input in between. \
+                Avoids re-fitting on near-identical data in long optimization \
+                runs, at the cost of normalizing with slightly stale \
+                statistics. Values above 1 require a separate step instance \
+                for each normalized output, so not an AggregateObjective step. \
+                Defaults to 1 (always re-fit).
+        """
         if not hasattr(scikit_normalizer, "fit_transform"):
             raise ValueError("Normalizer does not have fit_transform method")
+        if refit_interval < 1:
+            raise ValueError("Refit interval must be at least 1")
+
         self.normalizer = scikit_normalizer
+        self.refit_interval: int = refit_interval
+        self._evaluations: int = 0
+
+    def evaluate(self, input: list) -> np.ndarray:
+        arr = _as_float_array(input).reshape(-1, 1)
+
+        refit = self._evaluations % self.refit_interval == 0
+        self._evaluations += 1
+
+        if refit:
+            return self.normalizer.fit_transform(arr).ravel()
+
+        return self.normalizer.transform(arr).ravel()
+
+
+class _MinMaxNormalizer:
+    """
+    NumPy equivalent of `sklearn.preprocessing.MinMaxScaler` for the
+    single-feature arrays normalization steps operate on. Skips scikit-learn's
+    per-call input validation, which dominates the cost for short inputs.
+    """
+
+    def __init__(self) -> None:
+        self.scale_: Optional[np.ndarray] = None
+        self.min_: Optional[np.ndarray] = None
+
+    def fit_transform(self, X: np.ndarray) -> np.ndarray:
+        if np.isinf(X).any():
+            raise ValueError("Input contains infinity")
+
+        data_min = np.nanmin(X, axis=0)
+        data_range = np.nanmax(X, axis=0) - data_min
+
+        # Near-constant inputs are not scaled, as in scikit-learn
+        data_range[data_range < 10 * np.finfo(data_range.dtype).eps] = 1.0
+
+        self.scale_ = 1.0 / data_range
+        self.min_ = -data_min * self.scale_
+        return self.transform(X)
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        if self.scale_ is None:
+            raise ValueError("Normalizer has not been fitted")
+
+        return X * self.scale_ + self.min_
+
+
+def _as_float_array(values: Union[np.ndarray, list]) -> np.ndarray:
+    """Convert a flat sequence of outputs into a float64 array. Lists are
+    converted in a single pass with `np.fromiter`, and arrays are not copied."""
+    if isinstance(values, np.ndarray):
+        return np.asarray(values, dtype=np.float64)
+
+    try:
+        return np.fromiter(values, dtype=np.float64, count=len(values))
+    except (TypeError, ValueError):
+        # E.g. None-valued or nested outputs, which np.asarray handles
+        return np.asarray(values, dtype=np.float64)
+
+
+def _batch_n_jobs(n_jobs: Optional[int], n_cases: int) -> int:
+    """Concurrent evaluations for a batch: `config.MAX_IO_WORKERS` by default."""
+    if n_jobs is not None:
+        return n_jobs
 
-    def evaluate(self, input: list) -> list:
-        return list(self.normalizer.fit_transform(np.array(input).reshape(-1, 1)))
+    return max(1, min(config.MAX_IO_WORKERS, n_cases))
@@ -1,8 +1,18 @@
 import logging
 from typing import Any, Literal, Optional, Type, Union
 
+import numpy as np
+
 from flowboost.openfoam.dictionary import DictionaryLink
 
+# Supported dimension value types and their string representations
+_TYPE_MAP: dict[Type, str] = {
+    int: "int",
+    float: "float",
+    bool: "bool",
+    str: "str"
+}
+
 
 class Dimension:
     def __init__(self, name: str, type: Literal["range", "fixed", "choice"]):
@@ -78,9 +88,14 @@ class Dimension:
         if dtype is None:
             dtype = cls._infer_type(choices)
 
-        # Ensure all choices match the determined dtype
-        dim.values = [cls._ensure_types_match(
-            choice, dtype) for choice in choices]
+        # Ensure all choices match the determined dtype. Plain numeric choices
+        # are cast to float in one go; other cases are converted per element,
+        # as NumPy's casting rules differ for e.g. bools and strings.
+        if dtype is float and all(type(c) in (int, float) for c in choices):
+            dim.values = np.asarray(choices, dtype=np.float64).tolist()
+        else:
+            dim.values = [cls._ensure_types_match(
+                choice, dtype) for choice in choices]
         dim.value_type = Dimension._get_value_type_str(dtype)
 
         return dim
@@ -97,6 +112,10 @@ class Dimension:
         # Use the type of the first element as the reference type
         inferred_type = type(values[0])
 
+        # Common case: all elements are already of the same type
+        if all(type(value) is inferred_type for value in values):
+            return inferred_type
+
         # Check all elements can be converted to the inferred type
         for value in values:
             if not isinstance(value, inferred_type):
@@ -129,16 +148,9 @@ class Dimension:
         """
         Converts a type (e.g., int, float, bool, str) to its string representation.
         """
-        type_map = {
-            int: "int",
-            float: "float",
-            bool: "bool",
-            str: "str"
-        }
-
-        # Check if the value_type is in the type_map and return its string repr
-        if value_type in type_map:
-            return type_map[value_type]
+        # Check if the value_type is in the type map and return its string repr
+        if value_type in _TYPE_MAP:
+            return _TYPE_MAP[value_type]
         else:
             raise ValueError(
                 f"Unsupported type {value_type}, must be (int, float, bool, str)")
@@ -7,8 +7,14 @@ def generate():
     if not req_p.exists():
         req_p.mkdir(exist_ok=True)
 
-    reqs = "poetry export -f requirements.txt --output requirements/requirements.txt --without dev --without-hashes"
-    subprocess.run([reqs], shell=True, check=True)
+    export = ["poetry", "export", "-f", "requirements.txt", "--without-hashes"]
+    commands = [
+        export + ["--output", "requirements/requirements.txt", "--without", "dev"],
+        export + ["--output", "requirements/requirements_dev.txt", "--with", "dev"],
+    ]
 
-    reqs_dev = "poetry export -f requirements.txt --output requirements/requirements_dev.txt --with dev --without-hashes"
-    subprocess.run([reqs_dev], shell=True, check=True)
+    # The exports are independent: run them concurrently
+    processes = [subprocess.Popen(cmd) for cmd in commands]
+    for cmd, process in zip(commands, processes):
+        if process.wait() != 0:
+            raise subprocess.CalledProcessError(process.returncode, cmd)
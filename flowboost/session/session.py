@@ -1,21 +1,35 @@
+import copy
 import importlib.resources as pkg_resources
-import json
 import logging
+import os
+import re
 import shutil
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Iterator, Optional, Union
+
+import tomlkit
 
 from flowboost.config import config
 from flowboost.manager.manager import JobV2, Manager
-from flowboost.openfoam.case import Case, path_is_foam_dir, unique_id
-from flowboost.openfoam.dictionary import Dictionary, DictionaryLink, DictionaryReader
+from flowboost.openfoam.case import DEFAULT_METADATA, Case, path_is_foam_dir, unique_id
+from flowboost.openfoam.dictionary import DictionaryLink, DictionaryReader
 from flowboost.openfoam.types import FOAMType
 from flowboost.optimizer.acquisition_offload import OFFLOAD_SCRIPT
-from flowboost.optimizer.backend import DEFAULT_OFFLOAD_RESULT_FNAME
-from flowboost.optimizer.interfaces.Ax import Backend
+from flowboost.optimizer.backend import DEFAULT_OFFLOAD_RESULT_FNAME, Backend
 from flowboost.optimizer.search_space import Dimension
+from flowboost.utilities import serialization
+from flowboost.utilities.time import mtime_is_settled
+
+# Maximum number of case metadata files kept in a session's restore cache
+_RESTORE_CACHE_SIZE: int = 512
+
+# Stage index of a case directory name, e.g. 3 for "stage003.01_<uid>"
+_STAGE_RE = re.compile(r"^stage(\d+)\.")
 
 
 class Session:
@@ -64,6 +78,16 @@ class Session:
         self._template_case: Optional[Case] = None
         self._template_case_add_files: Optional[list[str]] = []
 
+        # Next case stage index: resolved from the case directories on first use
+        self._next_stage: Optional[int] = None
+
+        # Scanned directory path -> (mtime, is a FOAM case directory)
+        self._foam_dir_cache: dict[str, tuple[int, bool]] = {}
+
+        # Case path -> (metadata mtime, parsed metadata), in LRU order
+        self._restore_cache: OrderedDict[str, tuple[int, dict]] = OrderedDict()
+        self._restore_cache_lock = threading.Lock()
+
         if Path(self.data_dir, config.DEFAULT_CONFIG_NAME).exists():
             # Check if we can restore instead
             logging.info(f"Restoring session ({self.data_dir})")
@@ -75,15 +99,36 @@ class Session:
 
     def get_all_cases(self, include_failed: bool = True) -> list[Case]:
         """
-        Get finished and pending cases in one list.
+        Get finished and pending cases in one list. Both directories are
+        scanned, and their cases restored, in one pass.
+
+        Args:
+            include_failed (bool, optional): If failed cases should be \
+                included. Defaults to True.
 
         Returns:
             list[Case]: List of finished + pending cases
         """
-        return (
-            self.get_finished_cases(include_failed=include_failed)
-            + self.get_pending_cases()
-        )
+        cases = self._scan_foam_dirs(self.archival_dir, self.pending_dir)
+
+        if include_failed:
+            return cases
+
+        return [c for c in cases if c.success is not False]
+
+    def get_all_case_names(self) -> list[str]:
+        """
+        Get the directory names of finished and pending cases, without
+        restoring the cases themselves.
+
+        Returns:
+            list[str]: Names of finished + pending cases
+        """
+        return [
+            entry.name
+            for entry in self._iter_dirs(self.archival_dir, self.pending_dir)
+            if path_is_foam_dir(entry.path)
+        ]
 
     def get_finished_cases(
         self, include_failed: bool = False, batch_process: bool = False
@@ -99,15 +144,14 @@ class Session:
             batch_process (bool, optional): If cases should also be batch \
                 processed before returning them. All cases, despite their \
                 current `success` are always re-evaluated to accommodate for \
-                changes in objective functions. Defaults to False.
+                changes in objective functions, unless output caching is \
+                enabled for an objective (`Objective.cache_outputs`). \
+                Defaults to False.
 
         Returns:
             list[Case]: _description_
         """
-        cases: list[Case] = []
-        for p in filter(Path.is_dir, self.archival_dir.iterdir()):
-            if path_is_foam_dir(p):
-                cases.append(Case.try_restoring(p))
+        cases = self._scan_foam_dirs(self.archival_dir)
 
         if batch_process and cases:
             # Executes the post-processing steps while handling potential case
@@ -128,11 +172,7 @@ class Session:
         Returns:
             list[Case]: _description_
         """
-        cases: list[Case] = []
-        for p in filter(Path.is_dir, self.archival_dir.iterdir()):
-            if path_is_foam_dir(p):
-                cases.append(Case.try_restoring(p))
-
+        cases = self._scan_foam_dirs(self.archival_dir)
         return [c for c in cases if c.success is False]
 
     def get_pending_cases(self) -> list[Case]:
@@ -143,12 +183,100 @@ class Session:
         Returns:
             list[Case]: Discovered pending cases
         """
-        cases = []
-        for p in filter(Path.is_dir, self.pending_dir.iterdir()):
-            if path_is_foam_dir(p):
-                cases.append(Case.try_restoring(p))
+        return self._scan_foam_dirs(self.pending_dir)
+
+    @staticmethod
+    def _iter_dirs(*roots: Path) -> Iterator[os.DirEntry]:
+        """
+        Yields the sub-directories directly under each of `roots`, in order.
+        Uses `os.scandir`, as its entries cache the file type from the
+        directory read, avoiding a `stat()` per entry.
+        """
+        for root in roots:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        yield entry
+
+    def _scan_foam_dirs(self, *roots: Path) -> list[Case]:
+        """
+        Restores a Case for each OpenFOAM case directory directly under
+        `roots`. The I/O-bound case restoration is done in a thread pool of
+        up to `config.MAX_IO_WORKERS` threads.
+
+        Whether a directory is a case directory is cached by its mtime, which
+        changes when entries (e.g. `constant`, `system`) are added or removed.
+        Unchanged directories are thus not re-checked on repeated scans.
+        Recently modified directories are always re-checked, see
+        `mtime_is_settled`.
+
+        Args:
+            roots (Path): Directories to scan
+
+        Returns:
+            list[Case]: Discovered cases, in directory listing order
+        """
+        paths: list[str] = []
+        for entry in self._iter_dirs(*roots):
+            mtime = entry.stat().st_mtime_ns
+            cached = self._foam_dir_cache.get(entry.path)
+
+            if cached is not None and cached[0] == mtime and mtime_is_settled(mtime):
+                if cached[1]:
+                    paths.append(entry.path)
+                continue
+
+            paths.append(entry.path)
+            self._foam_dir_cache[entry.path] = (mtime, False)
+
+        workers = min(config.MAX_IO_WORKERS, len(paths))
+        if workers < 2:
+            cases = list(map(self._restore_if_foam_dir, paths))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                cases = list(executor.map(self._restore_if_foam_dir, paths))
+
+        return [case for case in cases if case is not None]
+
+    def _restore_if_foam_dir(self, path: str) -> Optional[Case]:
+        mtime, is_foam_dir = self._foam_dir_cache[path]
+        if not is_foam_dir:
+            if not path_is_foam_dir(path):
+                return None
+
+            self._foam_dir_cache[path] = (mtime, True)
 
-        return cases
+        return self._restore_case(path)
+
+    def _restore_case(self, path: str) -> Case:
+        """
+        Restores a case as a new Case object, re-using the parsed metadata
+        file if it has not been modified since it was last read. Recently
+        modified metadata is always read from disk, see `mtime_is_settled`.
+        """
+        metadata_file = os.path.join(path, DEFAULT_METADATA)
+        try:
+            mtime = os.stat(metadata_file).st_mtime_ns
+        except FileNotFoundError:
+            return Case.try_restoring(Path(path))
+
+        with self._restore_cache_lock:
+            cached = self._restore_cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                self._restore_cache.move_to_end(path)
+                return Case.from_metadata(copy.deepcopy(cached[1]))
+
+        with open(metadata_file, "r") as toml_file:
+            metadata = tomlkit.load(toml_file).unwrap()
+
+        if mtime_is_settled(mtime):
+            with self._restore_cache_lock:
+                self._restore_cache[path] = (mtime, metadata)
+                self._restore_cache.move_to_end(path)
+                if len(self._restore_cache) > _RESTORE_CACHE_SIZE:
+                    self._restore_cache.popitem(last=False)
+
+        return Case.from_metadata(copy.deepcopy(metadata))
 
     def start(self):
         """
@@ -190,11 +318,15 @@ class Session:
                 self.handle_finished_acquisition_job(finished[0])
                 continue
 
-            for job in finished:
-                logging.info(f"Moving data for finished job {job}")
-                case_dest = Path(self.archival_dir, job.wdir.name)
-                self.job_manager.move_data_for_job(job=job, dest=case_dest)
-                Case(case_dest).post_evaluation_update(job.to_dict())
+            # Moving case data (e.g. to an archival drive) is I/O-bound and
+            # independent per job: overlap the moves in threads
+            workers = min(config.MAX_IO_WORKERS, len(finished))
+            if workers < 2:
+                for job in finished:
+                    self._archive_finished_job(job)
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    list(executor.map(self._archive_finished_job, finished))
 
             logging.info("Entering optimizer loop")
             new_cases = self.loop_optimizer_once(num_new_cases=free_slots)
@@ -203,6 +335,15 @@ class Session:
                 # TODO pass script args automatically
                 self.job_manager.submit_case(case)
 
+    def _archive_finished_job(self, job: JobV2):
+        if not self.job_manager:
+            raise ValueError("Cannot archive job data without a job manager")
+
+        logging.info(f"Moving data for finished job {job}")
+        case_dest = Path(self.archival_dir, job.wdir.name)
+        self.job_manager.move_data_for_job(job=job, dest=case_dest)
+        Case(case_dest).post_evaluation_update(job.to_dict())
+
     def loop_optimizer_once(self, num_new_cases: int) -> list[Case]:
         if self.backend.offload_acquisition:
             # If acquisition offload requested, initialize IPC JSON file
@@ -223,19 +364,25 @@ class Session:
             logging.error("Local optimization called with 0 num_new_cases")
             return []
 
-        # Get all finished cases and batch process them while doing so
-        finished_cases = self.get_finished_cases(batch_process=True)
+        # Get all finished cases and batch process them while doing so. The
+        # archival directory is scanned once for both finished and failed
+        # cases: failures found in batch processing are marked in-place.
+        archived_cases = self.get_finished_cases(
+            include_failed=True, batch_process=True
+        )
+        finished_cases = [c for c in archived_cases if c.success is not False]
+        failed_cases = [c for c in archived_cases if c.success is False]
 
         if finished_cases:
             # If any are finished, attach them
             logging.info("Running model update")
-            self.backend.tell(self.get_finished_cases(batch_process=True))
+            self.backend.tell(finished_cases)
 
         # If there are pending cases, attach them
         self.backend.attach_pending_cases(self.get_pending_cases())
 
         # Attach failed cases separately
-        self.backend.attach_failed_cases(self.get_failed_cases())
+        self.backend.attach_failed_cases(failed_cases)
 
         # Ready to get new cases
         logging.info(f"Running acquisition: manager had {num_new_cases} free slot(s)")
@@ -314,8 +461,7 @@ class Session:
         if not self.job_manager:
             raise ValueError("Cannot process acquisition result without a job manager!")
 
-        with open(result_json_f, "r") as json_f:
-            data = json.load(json_f)
+        data = serialization.load(result_json_f)
 
         # Standard checks
         if data.get("optimizer", "") != self.backend.type:
@@ -422,35 +568,33 @@ class Session:
         data = config.load(self.data_dir, from_file)
 
         # [session]
-        self.name = str(data.get("session", {}).get("name"))
-        self.data_dir = Path(data.get("session", {}).get("data_dir"))
-        self.pending_dir = Path(data.get("session", {}).get("case_dir"))
-        self.archival_dir = Path(data.get("session", {}).get("archival_dir"))
-        self.dataframe_format = str(
-            data.get("session", {}).get("dataframe_format", "polars")
-        )
-        self.created_at = datetime.fromisoformat(
-            data.get("session", {}).get("created_at")
-        )
+        session = data.get("session", {})
+        self.name = str(session.get("name"))
+        self.data_dir = Path(session.get("data_dir"))
+        self.pending_dir = Path(session.get("case_dir"))
+        self.archival_dir = Path(session.get("archival_dir"))
+        self.dataframe_format = str(session.get("dataframe_format", "polars"))
+        self.created_at = datetime.fromisoformat(session.get("created_at"))
 
         # [template]
-        self._template_case = Case.try_restoring(
-            str(data.get("template", {}).get("path"))
-        )
+        template = data.get("template", {})
+        self._template_case = Case.try_restoring(str(template.get("path")))
         self._template_case_add_files = [
-            str(item) for item in data.get("template", {}).get("additional_files")
+            str(item) for item in template.get("additional_files")
         ]
 
         # [optimizer]
-        backend_type = str(data.get("optimizer", {}).get("type", "Ax"))
+        optimizer = data.get("optimizer", {})
+        backend_type = str(optimizer.get("type", "Ax"))
         self.backend.create(backend_type)
-        offload = data.get("optimizer", {}).get("offload_acquisition", False)
+        offload = optimizer.get("offload_acquisition", False)
         if offload:
             self.backend.offload_acquisition = offload
 
         # [scheduler]
-        scheduler = data.get("scheduler", {}).get("type", "")
-        job_limit = data.get("scheduler", {}).get("job_limit", 1)
+        scheduler_config = data.get("scheduler", {})
+        scheduler = scheduler_config.get("type", "")
+        job_limit = scheduler_config.get("job_limit", 1)
 
         if scheduler != "":
             self.job_manager = Manager.create(
@@ -480,8 +624,12 @@ class Session:
         if self._template_case is None:
             raise ValueError("Template case is None: cannot generate cases")
 
+        # Links are the same for every case: verify them before cloning any
+        self._verify_suggestion_links(suggestions)
+
         # Get prefix for this batch
         stage_prefix = self._get_next_stage_prefix()
+        self._next_stage = stage_prefix + 1
 
         new_cases: list[Case] = []
 
@@ -515,28 +663,50 @@ class Session:
         self.persist()
         return new_cases
 
-    def _apply_suggestions_to_case(self, case: Case, suggestions: dict[Dimension, Any]):
+    @staticmethod
+    def _verify_suggestion_links(suggestions: list[dict[Dimension, Any]]):
         """
-        Apply a list of optimizer suggestions (dim -> new_value) to a Case.
+        Verify every suggested Dimension is linked to a dictionary entry.
 
         Args:
-            case (Case): Case to modify
-            suggestion (dict[Dimension, Any]): Suggestions to apply
+            suggestions (list[dict[Dimension, Any]]): Optimizer suggestions
 
         Raises:
-            ValueError: If a Dimension is missing a DictionaryLink
+            ValueError: If a Dimension is missing a DictionaryLink, or the \
+                link does not point to an entry
         """
-        for dim, new_val in suggestions.items():
+        dims = {dim for suggestion in suggestions for dim in suggestion}
+        for dim in dims:
             if dim.linked_entry is None:
                 raise ValueError(f"Dimension '{dim.name}' not linked to an entry")
 
-            reader = dim.linked_entry.reader(case.path)
-
-            if isinstance(reader, Dictionary):
+            if not dim.linked_entry.entry_path:
                 raise ValueError(
                     f"Dimension '{dim.name}' linked incorrectly: Entry missing"
                 )
 
+    def _apply_suggestions_to_case(self, case: Case, suggestions: dict[Dimension, Any]):
+        """
+        Apply a list of optimizer suggestions (dim -> new_value) to a Case.
+        The dimension links must have been verified with
+        `_verify_suggestion_links`.
+
+        Dimensions linked to the same dictionary file share one reader, so
+        the file's keywords are only discovered once per case.
+
+        Args:
+            case (Case): Case to modify
+            suggestion (dict[Dimension, Any]): Suggestions to apply
+        """
+        readers: dict[str, DictionaryReader] = {}
+        for dim, new_val in suggestions.items():
+            dict_path = dim.linked_entry.path
+            if dict_path not in readers:
+                readers[dict_path] = DictionaryReader(f"{case.path}/{dict_path}")
+
+            reader = dim.linked_entry.reader(
+                case.path, dictionary_reader=readers[dict_path]
+            )
             reader.write(new_value=new_val)
 
     def _serializable_suggestion_dict(
@@ -554,19 +724,18 @@ class Session:
         return ser_dict
 
     def _get_next_stage_prefix(self) -> int:
-        # Returns next stage index
-        cases = self.get_all_cases(include_failed=True)
-
-        if not cases:
-            return 1
-
-        # Separate names by '.' and remove the "stage" prefix
-        names = [c.name.split(".")[0].replace("stage", "") for c in cases]
-
-        # Process to ints
-        int_names = [int(name) for name in names if name.isdigit()]
+        # Returns next stage index. Only the case directory names are needed,
+        # so the cases are not restored. The index is resolved once, and then
+        # tracked as new stages are created.
+        if self._next_stage is None:
+            names = (
+                entry.name
+                for entry in self._iter_dirs(self.pending_dir, self.archival_dir)
+            )
+            stages = [int(m.group(1)) for m in map(_STAGE_RE.match, names) if m]
+            self._next_stage = max(stages, default=0) + 1
 
-        return max(int_names) + 1
+        return self._next_stage
 
     def _ensure_dirs(self):
         if not self.data_dir.exists():
@@ -599,15 +768,26 @@ class Session:
                 "No search space found for backend (session.backend.search_space)"
             )
 
-        # Next, for each dimension, verify the linked entry exists in template
+        # Next, for each dimension, verify the linked entry exists in template.
+        # Dimensions linked to the same dictionary file share one reader, so
+        # the file's keywords are only discovered once.
+        readers: dict[str, DictionaryReader] = {}
         for dim in self.backend.dimensions:
             if not isinstance(dim.linked_entry, DictionaryLink):
                 raise ValueError(
                     f"Dictionary link must be a DictionaryLink (dim='{dim.name}')"
                 )
 
+            dict_path = dim.linked_entry.path
+            if dict_path not in readers:
+                readers[dict_path] = DictionaryReader(
+                    f"{self._template_case.path}/{dict_path}"
+                )
+
             # Running the reader should yield an Entry
-            entry_reader = dim.linked_entry.reader(self._template_case.path)
+            entry_reader = dim.linked_entry.reader(
+                self._template_case.path, dictionary_reader=readers[dict_path]
+            )
 
             # If the type is a DictionaryReader, the user has only provided a
             # link to a foam dictionary file, but no entry
@@ -640,12 +820,15 @@ class Session:
                 "Will not remove folder unless it contains known directories"
             )
 
-        has_case_data = any(Path(self.pending_dir).iterdir())
+        # Only the first directory entry is read
+        with os.scandir(self.pending_dir) as it:
+            has_case_data = next(it, None) is not None
 
         if (self.data_dir == self.archival_dir) and has_case_data:
             raise ValueError("Refusing to delete: case data in /case_data")
 
         shutil.rmtree(self.data_dir)
+        self._next_stage = None
 
         if self.archival_dir.exists():
             logging.warning(f"Not removing archival directory [{self.archival_dir}]")
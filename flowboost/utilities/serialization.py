@@ -0,0 +1,124 @@
+"""
+JSON (de)serialization helpers. If the optional `orjson` package is
+installed, it is used for encoding and decoding; otherwise, the standard
+library's json module is used.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Iterable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Note, that orjson serializes NaN and infinite floats as `null`.
+
+    Args:
+        obj (Any): Object to serialize
+
+    Returns:
+        bytes: Serialized JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+
+    return json.dumps(obj).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Deserialize JSON. Falls back to the standard library's parser if orjson
+    rejects the input: this is the case for documents containing the
+    non-standard `NaN` and `Infinity` tokens that json.dump emits.
+
+    Args:
+        data (bytes | str): JSON document
+
+    Returns:
+        Any: Deserialized object
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(data)
+
+
+def dump(obj: Any, to_file: Path | str):
+    with open(to_file, "wb") as f:
+        f.write(dumps(obj))
+
+
+def load(from_file: Path | str) -> Any:
+    with open(from_file, "rb") as f:
+        return loads(f.read())
+
+
+def dump_streaming(
+    header: dict[str, Any],
+    field: str,
+    entries: Iterable[tuple[Any, Any]],
+    to_file: Path | str,
+):
+    """
+    Write a JSON object one entry at a time, without first assembling the
+    full document in memory. The written object consists of the `header`
+    fields, followed by `field`, which maps the keys in `entries` to their
+    values.
+
+    Args:
+        header (dict[str, Any]): Top-level fields written first
+        field (str): Name of the streamed mapping field
+        entries (Iterable[tuple[Any, Any]]): Key-value pairs of the mapping. \
+            Keys are converted to strings.
+        to_file (Path | str): Output file
+    """
+    with open(to_file, "wb") as f:
+        f.write(b"{")
+        for key, value in header.items():
+            f.write(dumps(key) + b":" + dumps(value) + b",")
+
+        f.write(dumps(field) + b":{")
+        for i, (key, value) in enumerate(entries):
+            f.write((b"," if i else b"") + dumps(str(key)) + b":" + dumps(value))
+
+        f.write(b"}}")
+
+
+def dump_streaming_list(
+    header: dict[str, Any],
+    field: str,
+    items: Iterable[Any],
+    to_file: Path | str,
+):
+    """
+    Like `dump_streaming`, but `field` holds a list: `items` are encoded and
+    written one at a time, each on its own line.
+
+    Args:
+        header (dict[str, Any]): Top-level fields written first
+        field (str): Name of the streamed list field
+        items (Iterable[Any]): Elements of the list
+        to_file (Path | str): Output file
+    """
+    with open(to_file, "wb") as f:
+        f.write(b"{")
+        for key, value in header.items():
+            f.write(dumps(key) + b":" + dumps(value) + b",")
+
+        f.write(dumps(field) + b":[")
+        for i, item in enumerate(items):
+            f.write((b",\n" if i else b"\n") + dumps(item))
+
+        f.write(b"\n]}")
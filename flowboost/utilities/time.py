@@ -1,5 +1,6 @@
+import time
 from datetime import timedelta
-from typing import Optional
+from typing import Optional, Union
 
 PERIODS = [
     ('year',   3600*24*365),
@@ -10,20 +11,42 @@ PERIODS = [
     ('second', 1)
 ]
 
+# Coarse file system timestamps may not reflect a write made within the same
+# tick (git's "racy" timestamps): mtimes younger than this are not trusted
+MTIME_SETTLE_NS: int = 2_000_000_000
 
-def td_format(td: timedelta, precision: Optional[int] = None) -> str:
+
+def mtime_is_settled(mtime_ns: int) -> bool:
+    """
+    Check if a modification time is old enough for caches to rely on it, i.e.
+    if any later write to the file is guaranteed to change its mtime.
+
+    Args:
+        mtime_ns (int): Modification time, in nanoseconds (`st_mtime_ns`)
+
+    Returns:
+        bool: True if the mtime is older than `MTIME_SETTLE_NS`
+    """
+    return mtime_ns < time.time_ns() - MTIME_SETTLE_NS
+
+
+def td_format(td: Union[timedelta, float], precision: Optional[int] = None) -> str:
     """
     Generate a human-readable, comma-separated string from a timedelta.
 
     Args:
-        td (timedelta): Timedelta
+        td (timedelta | float): Timedelta, or a duration in seconds
         precision (Optional[int], optional): Number of units to include. \
             Defaults to None.
 
     Returns:
         str: A human-readable string
     """
-    seconds = int(td.total_seconds())
+    if isinstance(td, timedelta):
+        seconds = int(td.total_seconds())
+    else:
+        seconds = int(td)
+
     if seconds == 0:
         return "0 seconds"
     elif seconds < 0:
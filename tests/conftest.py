@@ -5,11 +5,14 @@ import pytest
 from flowboost.openfoam.case import Case
 from flowboost.openfoam.interface import FOAM
 
+# Test data directory, resolved once at collection
+_DATA_DIR = Path(__file__).resolve().parent / "data"
+
 
 @pytest.fixture(scope="session")
 def data_dir():
     """Fixture to provide the path to the data directory."""
-    return Path(__file__).parent / "data"
+    return _DATA_DIR
 
 
 @pytest.fixture(scope="session")
@@ -25,11 +28,43 @@ def foam_in_env():
     return True
 
 
+@pytest.fixture(scope="session")
+def tutorial_source(foam_in_env, tmp_path_factory) -> Path:
+    """
+    The aachenBomb tutorial case, cloned once per session. Shared between
+    tests: use it as a read-only template, or copy it before modifying.
+    """
+    case_path = tmp_path_factory.mktemp("foam_src") / "tutorialCase"
+    return Case.from_tutorial("multicomponentFluid/aachenBomb", case_path).path
+
+
 @pytest.fixture(scope="session")
 def test_case(data_dir):
-    case_path = Path(data_dir)
-    assert (
-        case_path.exists()
-    ), f"Path to example case data not found: [{case_path.resolve()}]"
-    case = Case(case_path)
+    assert data_dir.exists(), f"Path to example case data not found: [{data_dir}]"
+    case = Case(data_dir)
     yield case
+
+
+class _StubCase:
+    # Minimal stand-in for an evaluated Case, identified by its name
+    def __init__(self, name: str, value: float = 0.0, point: float = None):
+        self.id = name
+        self.name = name
+        self.success = None
+        self.value = value
+        self.point = value if point is None else point
+
+    def mark_failed(self):
+        self.success = False
+
+    def parametrize_configuration(self, dimensions):
+        return {dim.name: 1e-3 * (1 + self.point) for dim in dimensions}
+
+    def objective_function_outputs(self, objectives):
+        return {objective.name: self.value for objective in objectives}
+
+
+@pytest.fixture
+def stub_case():
+    """Factory for Case stand-ins: `stub_case(name, value=0.0, point=None)`."""
+    return _StubCase
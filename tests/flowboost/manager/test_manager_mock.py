@@ -1,10 +1,13 @@
 import json
 import logging
+import shutil
+import subprocess
 from pathlib import Path
 from typing import Any
 
 import pytest
 
+from flowboost.manager.interfaces.sge import SGE
 from flowboost.manager.manager import JobV2, Manager
 from flowboost.openfoam.case import Case
 
@@ -95,6 +98,15 @@ def test_manager_restore_state(tmp_path, mock_job):
     # Further assertions to validate the restored state matches
 
 
+def test_manager_restore_acquisition_job(tmp_path, mock_job):
+    manager = MockManager(wdir=tmp_path, job_limit=5)
+    manager.acquisition_job = mock_job
+    manager._save_state()
+
+    restored = MockManager(wdir=tmp_path, job_limit=5)
+    assert restored.acquisition_job == mock_job
+
+
 def test_status_print(manager: Manager):
     job_running = JobV2(
         id="124",
@@ -115,3 +127,39 @@ def test_status_print(manager: Manager):
     assert job_running.id in status_output
     assert job_finished.id in status_output
     logging.info("Manager status print:\n" + status_output)
+
+
+def test_finished_job_polling(manager: Manager):
+    for i in range(5):
+        name = "finished_job" if i % 2 else "running_job"
+        manager.job_pool.add(JobV2(id=str(i), name=name, wdir=Path("/tmp")))
+
+    assert manager._finished_job_ids(["0", "1", "3"]) == {"1", "3"}
+    assert manager.free_slots() == manager.job_limit - 3
+
+    free_slots, finished, acquisition = manager.do_monitoring()
+    assert {job.id for job in finished} == {"1", "3"}
+    assert free_slots == manager.job_limit - 3
+    assert not acquisition
+
+
+def test_sge_finished_job_ids(monkeypatch, tmp_path):
+    qstat = (
+        "job-ID  prior   name       user   state submit/start at     queue  slots\n"
+        "--------------------------------------------------------------------------\n"
+        "    101 0.55500 flwbst_a   user   r     01/01/2024 00:00:00 all.q  1\n"
+        "    103 0.00000 flwbst_c   user   qw    01/01/2024 00:00:00        1\n"
+    )
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout=qstat, stderr="")
+
+    monkeypatch.setattr(subprocess, "run", run)
+    monkeypatch.setattr(shutil, "which", lambda cmd: f"/usr/bin/{cmd}")
+    manager = SGE(wdir=tmp_path, job_limit=5)
+
+    # All jobs are queried with a single qstat call
+    assert manager._finished_job_ids(["101", "102", "103"]) == {"102"}
+    assert calls == [["qstat"]]
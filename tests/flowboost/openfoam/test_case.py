@@ -1,5 +1,7 @@
 import json
 import logging
+import os
+import shutil
 from pathlib import Path
 from uuid import uuid4
 
@@ -18,9 +20,15 @@ def new_case_dir(tmp_path):
 
 
 @pytest.fixture
-def tutorial_case(foam_in_env, tmp_path):
+def tutorial_case(tutorial_source, tmp_path):
+    """
+    Working copy of the session's tutorial case. Files are hard links to the
+    session copy: they may be replaced or deleted, but not modified in place.
+    """
     case_path = tmp_path / "tutorialCase"
-    case = Case.from_tutorial("multicomponentFluid/aachenBomb", case_path)
+    shutil.copytree(tutorial_source, case_path, copy_function=os.link)
+    case = Case(case_path)
+    case._based_on_case = tutorial_source
     yield case
     case._delete_all_data()
 
@@ -1,9 +1,11 @@
 import logging
+import os
 from pathlib import Path
 
 import polars as pl
 
 from flowboost.openfoam.case import Case
+from flowboost.openfoam.data import Data
 
 
 def test_data_loading(data_dir):
@@ -35,3 +37,37 @@ def test_data_loading(data_dir):
     # Entire "clock" column
     cpu_col = time_df.select(pl.col("clock"))
     print(cpu_col)
+
+
+def test_dataframe_cache(tmp_path):
+    fo_file = Path(tmp_path, "postProcessing", "averagePT", "0", "volFieldValue.dat")
+    fo_file.parent.mkdir(parents=True)
+    fo_file.write_text("# Time\tvolAverage(T)\n0\t800\n1\t1955\n")
+    os.utime(fo_file, ns=(0, 0))
+
+    data = Data(tmp_path)
+    df = data.simple_function_object_reader("averagePT")
+    assert df.select(pl.max("volAverage(T)")).item() == 1955
+
+    # Cached copies are served until the file changes
+    assert data.simple_function_object_reader("averagePT").equals(df)
+    assert len(data._dataframe_cache) == 1
+
+    fo_file.write_text("# Time\tvolAverage(T)\n0\t800\n1\t2000\n")
+    os.utime(fo_file, ns=(10**9, 10**9))
+    df = data.simple_function_object_reader("averagePT")
+    assert df.select(pl.max("volAverage(T)")).item() == 2000
+
+    data.invalidate()
+    assert not data._dataframe_cache
+
+
+def test_lazy_backend(tmp_path):
+    fo_file = Path(tmp_path, "postProcessing", "averagePT", "0", "volFieldValue.dat")
+    fo_file.parent.mkdir(parents=True)
+    fo_file.write_text("# Time\tvolAverage(T)\n0\t800\n1\t1955\n")
+
+    # Streaming collection, with the collect() API of the installed Polars
+    data = Data(tmp_path, lazy_backend=True)
+    df = data.simple_function_object_reader("averagePT")
+    assert df.select(pl.max("volAverage(T)")).item() == 1955
@@ -1,6 +1,8 @@
 import logging
+import os
+from itertools import islice
 from pathlib import Path
-from typing import Callable, Generator
+from typing import Callable
 
 import pytest
 
@@ -17,27 +19,27 @@ def tutorial_dictionary_reader(foam_in_env, tmp_path) -> Callable[[str], Diction
     return _reader
 
 
-@pytest.fixture
-def foam_tutorial_dict_paths(foam_in_env) -> Generator[Path, None, None]:
-    """Generates FOAM dictionary paths from tutorials folder."""
+@pytest.fixture(scope="session")
+def foam_tutorial_dict_paths(foam_in_env) -> tuple[Path, ...]:
+    """FOAM dictionary paths from tutorials folder, discovered once per session."""
     tutorials_path = FOAM.tutorials()
     assert tutorials_path.exists(
     ), f"Tutorials folder does not exist: {tutorials_path}"
 
-    for constant_system_folder in tutorials_path.rglob('*'):
-        if constant_system_folder.name in ('constant', 'system'):
-            for foam_file in constant_system_folder.iterdir():
-                if foam_file.is_file() and foam_file.suffix != '.dat':
-                    yield foam_file
+    # os.walk reuses scandir's directory entries: no stat call per path
+    return tuple(
+        Path(root, file)
+        for root, _, files in os.walk(tutorials_path)
+        if os.path.basename(root) in ('constant', 'system')
+        for file in files
+        if not file.endswith('.dat')
+    )
 
 
 @pytest.mark.parametrize("limit", [None, 10])
 def test_init_on_all_tutorials(foam_tutorial_dict_paths, limit):
     """Test initializing Dictionaries on all tutorial paths, optionally limited."""
-    for i, foam_file in enumerate(foam_tutorial_dict_paths):
-        if limit and i >= limit:
-            break
-
+    for foam_file in islice(foam_tutorial_dict_paths, limit):
         reader = Dictionary.reader(foam_file)
         reader.preload()
 
@@ -136,3 +138,56 @@ def test_dimensioned_entry_RW(foam_in_env, test_case):
 
     # Dimensioned types
     # https://doc.cfd.direct/openfoam/user-guide-v11/basic-file-format
+
+
+def test_query_cache(tmp_path, monkeypatch):
+    # Stand-in foamDictionary, logging each invocation
+    calls = tmp_path / "calls"
+    foam_dictionary = tmp_path / "foamDictionary"
+    foam_dictionary.write_text(f"#!/bin/sh\necho call >> {calls}\necho a\n")
+    foam_dictionary.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+
+    dict_file = tmp_path / "physicalProperties"
+    dict_file.write_text("a 1;\n")
+    os.utime(dict_file, (0, 0))
+
+    Dictionary.clear_query_cache()
+    for _ in range(2):
+        reader = DictionaryReader(dict_file)
+        assert reader.entry("a") is not None
+
+    assert calls.read_text().count("call") == 1
+
+    # Modifying the file invalidates the cached query
+    os.utime(dict_file, (1, 1))
+    assert DictionaryReader(dict_file).entry("a") is not None
+    assert calls.read_text().count("call") == 2
+
+    # So does modifying an included file
+    include_file = tmp_path / "common"
+    include_file.write_text("b 2;\n")
+    dict_file.write_text('#include "common"\na 1;\n')
+    os.utime(include_file, (0, 0))
+    os.utime(dict_file, (2, 2))
+    for _ in range(2):
+        assert DictionaryReader(dict_file).entry("a") is not None
+
+    assert calls.read_text().count("call") == 3
+
+    os.utime(include_file, (1, 1))
+    assert DictionaryReader(dict_file).entry("a") is not None
+    assert calls.read_text().count("call") == 4
+
+    # Queries depending on a file are dropped when it is written to
+    Dictionary.clear_query_cache(include_file)
+    assert DictionaryReader(dict_file).entry("a") is not None
+    assert calls.read_text().count("call") == 5
+
+    # Dictionaries with untracked dependencies are never cached
+    dict_file.write_text('#includeEtc "caseDicts/setConstraintTypes"\na 1;\n')
+    os.utime(dict_file, (3, 3))
+    for _ in range(2):
+        assert DictionaryReader(dict_file).entry("a") is not None
+
+    assert calls.read_text().count("call") == 7
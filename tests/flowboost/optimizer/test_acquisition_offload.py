@@ -0,0 +1,34 @@
+import pytest
+
+from flowboost.optimizer.acquisition_offload import parse_args
+
+ARGV = [
+    "--optimizer",
+    "AxBackend",
+    "--model_snapshot=model.json",
+    "--data_snapshot",
+    "data.json",
+    "--num_trials",
+    "2",
+    "--output_path",
+    "out.json",
+]
+
+
+def test_parse_args():
+    args = parse_args(ARGV)
+    assert args["optimizer"] == "AxBackend"
+    assert args["model_snapshot"] == "model.json"
+    assert args["num_trials"] == "2"
+
+
+def test_parse_args_missing_value():
+    # A flag must not consume the next flag as its value
+    with pytest.raises(ValueError, match="--optimizer"):
+        parse_args(["--optimizer"] + ARGV[2:])
+
+    with pytest.raises(ValueError, match="--output_path"):
+        parse_args(ARGV[:-1])
+
+    with pytest.raises(ValueError, match="Missing required"):
+        parse_args(ARGV[2:])
@@ -1,4 +1,5 @@
 import logging
+from pathlib import Path
 
 import pytest
 
@@ -6,6 +7,7 @@ from flowboost.openfoam.dictionary import DictionaryLink
 from flowboost.optimizer.interfaces.Ax import AxBackend
 from flowboost.optimizer.objectives import Objective
 from flowboost.optimizer.search_space import Dimension
+from flowboost.utilities import serialization
 
 
 @pytest.fixture
@@ -67,3 +69,128 @@ def test_tell(Ax_backend, test_case, foam_in_env):
 
     logging.info("Running tell()")
     Ax_backend.tell([test_case])
+
+
+def test_duplicate_dimension_names(Ax_backend):
+    Ax_backend.set_search_space(Ax_backend.dimensions * 2)
+    with pytest.raises(ValueError):
+        Ax_backend.initialize()
+
+
+def test_complete_trials(Ax_backend, stub_case):
+    Ax_backend.initialize()
+
+    # Attach trials directly, using stand-in cases
+    cases = [stub_case("case_0", 0.0), stub_case("case_1", 1.0)]
+    for i, case in enumerate(cases):
+        _, idx = Ax_backend.client.attach_trial(
+            parameters={"Test Dim": 1e-3 * (i + 1)}, arm_name=f"case_{i}"
+        )
+        Ax_backend._trial_index_case_mapping[case] = idx
+
+    outputs = {case: {"Test Objective": float(i)} for i, case in enumerate(cases)}
+    Ax_backend._complete_trials(cases, outputs)
+
+    for idx in Ax_backend._trial_index_case_mapping.values():
+        assert Ax_backend.client.get_trial(idx).status.is_completed
+
+    df = Ax_backend.client.experiment.fetch_data().df
+    assert sorted(df["mean"]) == [0.0, 1.0]
+
+
+def test_incremental_tell(Ax_backend, caplog, stub_case):
+    Ax_backend.incremental = True
+    Ax_backend.initialize()
+    client = Ax_backend.client
+
+    Ax_backend.attach_pending_cases([stub_case("case_1", 1.0)])
+    Ax_backend.tell([stub_case("case_0", 0.0)])
+
+    # Cases are re-created between loops: the first one must not be re-attached
+    with caplog.at_level(logging.WARNING):
+        Ax_backend.tell(
+            [stub_case("case_0", 0.0), stub_case("case_1", 1.0)]
+        )
+
+    assert Ax_backend.client is client
+    assert len(client.experiment.trials) == 2
+    assert all(t.status.is_completed for t in client.experiment.trials.values())
+    assert "['case_0']" in caplog.text
+
+
+def test_duplicate_parametrization_results(Ax_backend, stub_case):
+    # Cases with identical parametrizations keep their own results
+    Ax_backend.initialize()
+    Ax_backend.tell(
+        [
+            stub_case("case_0", 1.0, point=0.0),
+            stub_case("retry", 5.0, point=0.0),
+        ]
+    )
+
+    trials = Ax_backend.client.experiment.trials
+    assert len(trials) == 2
+    assert all(t.status.is_completed for t in trials.values())
+    assert trials[0].arm.name == trials[1].arm.name
+
+    df = Ax_backend.client.experiment.fetch_data().df
+    assert sorted(df["mean"]) == [1.0, 5.0]
+
+
+def test_duplicate_parametrization_abandoned(Ax_backend, stub_case):
+    # A finished retry of an abandoned case is attached as a new trial
+    Ax_backend.incremental = True
+    Ax_backend.initialize()
+
+    Ax_backend.attach_failed_cases([stub_case("case_0", 0.0)])
+    Ax_backend.tell([stub_case("retry", 0.0)])
+
+    trials = Ax_backend.client.experiment.trials
+    assert len(trials) == 2
+    assert trials[0].status.is_abandoned
+    assert trials[1].status.is_completed
+    assert not trials[1].lookup_data().df.empty
+
+
+def test_duplicate_parametrization_pending(Ax_backend, stub_case):
+    # Abandoning a failed case leaves its pending retry running
+    Ax_backend.initialize()
+
+    Ax_backend.attach_pending_cases([stub_case("retry", 0.0)])
+    Ax_backend.attach_failed_cases([stub_case("case_0", 0.0)])
+
+    trials = Ax_backend.client.experiment.trials
+    assert len(trials) == 2
+    assert trials[0].status.is_running
+    assert trials[1].status.is_abandoned
+
+
+def test_snapshot_restore_round_trip(Ax_backend, tmp_path, stub_case):
+    # A restored client keeps the shared arms of duplicate parametrizations,
+    # and duplicates in the data snapshot attach on top of them
+    Ax_backend.offload_acquisition = True
+    Ax_backend.initialize()
+    Ax_backend.tell(
+        [
+            stub_case("case_0", 1.0, point=0.0),
+            stub_case("retry", 5.0, point=0.0),
+        ]
+    )
+
+    model_snapshot, data_snapshot = Ax_backend.prepare_for_acquisition_offload(
+        finished_cases=[stub_case("case_1", 2.0, point=0.0)],
+        pending_cases=[stub_case("case_2", 0.0)],
+        save_in=tmp_path,
+    )
+
+    restored = AxBackend.restore_from_state_snapshot(model_snapshot)
+    trials = restored.client.experiment.trials
+    assert len(trials) == 2
+    assert trials[0].arm.name == trials[1].arm.name == "case_0"
+
+    output_path = Path(tmp_path, "acquisition.json")
+    AxBackend.offloaded_acquisition(model_snapshot, data_snapshot, 1, output_path)
+
+    acquisition = serialization.load(output_path)
+    assert acquisition["optimizer"] == AxBackend.__name__
+    assert len(acquisition["parametrizations"]) == 1
@@ -1,14 +1,20 @@
-import polars as pl
+import numpy as np
+from sklearn.preprocessing import MinMaxScaler
 
 from flowboost.openfoam.case import Case
-from flowboost.optimizer.objectives import Objective
+from flowboost.optimizer.objectives import (
+    AggregateObjective,
+    Objective,
+    ScikitNormalizationStep,
+    _MinMaxNormalizer,
+)
 
 
 def max_temp_objective(case: Case) -> int:
     # Returns a value of 1955 for the default data
     df = case.data.simple_function_object_reader("averagePT")
     assert df is not None, "Dataframe could not be loaded"
-    return int(df.select(pl.max("volAverage(T)")).item())
+    return int(df["volAverage(T)"].max())
 
 
 def test_objective_initialization():
@@ -40,7 +46,18 @@ def test_normalization_step_addition():
         normalization_step="min-max",
     )
     method = objective._post_processing_steps[0][0]
-    assert method([0, 1, 2]) == [0, 0.5, 1]
+    assert method([0, 1, 2]).tolist() == [0, 0.5, 1]
+
+
+def test_min_max_normalizer_matches_scikit():
+    values = np.array([[3.0], [-1.5], [np.nan], [7.25], [0.0]])
+    expected = MinMaxScaler().fit_transform(values)
+    assert np.array_equal(
+        _MinMaxNormalizer().fit_transform(values), expected, equal_nan=True
+    )
+
+    # Constant inputs are not scaled
+    assert _MinMaxNormalizer().fit_transform(np.ones((3, 1))).tolist() == [[0.0]] * 3
 
 
 def test_data_retrieval_post_processing(test_case):
@@ -59,3 +76,106 @@ def test_data_retrieval_post_processing(test_case):
     post_out = objective.data_for_case(test_case, post_processed=True)
 
     assert post_out == 1955 + 1, f"Post-proc out = {post_out} != 1955+1"
+
+
+def test_aggregate_outputs():
+    objectives = [
+        Objective(name=f"Objective {i}", minimize=True, objective_function=lambda x: 1)
+        for i in range(2)
+    ]
+    aggregate = AggregateObjective(
+        name="Aggregate",
+        minimize=True,
+        objectives=objectives,
+        threshold=0.0,
+        weights=[1.0, 0.5],
+    )
+
+    assert aggregate.aggregate_outputs([(1.0, 2.0), (3.0, 4.0)]) == [2.0, 5.0]
+
+    # Post-processing steps are applied per objective
+    aggregate.attach_post_processing_step(lambda column: column / column.max())
+    outputs = np.array([(1.0, 2.0), (2.0, 8.0)])
+    processed = aggregate.apply_batch_post_processing(outputs)
+    assert processed.tolist() == [[0.5, 0.25], [1.0, 1.0]]
+    assert outputs.tolist() == [[1.0, 2.0], [2.0, 8.0]]
+
+
+def test_aggregate_failed_evaluations(stub_case):
+    objectives = [
+        Objective(name=f"Objective {i}", minimize=True, objective_function=f)
+        for i, f in enumerate([lambda c: len(c.id), lambda c: len(c.id) or None])
+    ]
+    aggregate = AggregateObjective(
+        name="Aggregate", minimize=True, objectives=objectives, threshold=0.0
+    )
+    aggregate.attach_post_processing_step(lambda column: column / column.max())
+
+    # Failed cases do not affect post-processing, and have no stored output
+    cases = [stub_case("a"), stub_case(""), stub_case("ab")]
+    assert aggregate.batch_process(cases) == [1.0, None, 2.0]
+    assert aggregate.data_for_case(cases[1]) is None
+    assert cases[1].success is False
+
+
+def test_parallel_aggregate_evaluation(stub_case):
+    objectives = [
+        Objective(name=f"Objective {i}", minimize=True, objective_function=f)
+        for i, f in enumerate([lambda c: len(c.id), lambda c: 2 * len(c.id)])
+    ]
+    aggregate = AggregateObjective(
+        name="Aggregate", minimize=True, objectives=objectives, threshold=0.0
+    )
+    aggregate.parallel_objectives = True
+
+    # Output order follows the order of the wrapped objectives
+    assert aggregate.evaluate(stub_case("abc")) == (3, 6)
+    assert aggregate.batch_process([stub_case("a"), stub_case("ab")]) == [3.0, 6.0]
+
+
+def test_evaluation_cache(stub_case):
+    calls = []
+    objective = Objective(
+        name="Cached", minimize=True, objective_function=lambda c: calls.append(c) or 1
+    )
+
+    case = stub_case("abcd1234")
+    assert objective.evaluate(case) == 1
+    assert objective.evaluate(case) == 1
+    assert len(calls) == 2
+
+    # Caching is opt-in
+    calls.clear()
+    objective.cache_outputs = True
+    assert objective.evaluate(case) == 1
+    assert objective.evaluate(case) == 1
+    assert len(calls) == 1
+
+    objective.evaluate(case, force=True)
+    assert len(calls) == 2
+
+    objective.clear_cache()
+    objective.evaluate(case)
+    assert len(calls) == 3
+
+    # Cached cases are not re-dispatched in batches
+    assert objective.batch_evaluate([case, case]) == [1, 1]
+    assert len(calls) == 3
+
+    # Replacing the objective function invalidates the cache
+    objective.objective_function = lambda c, kwargs={}: calls.append(c) or 2
+    assert objective.evaluate(case) == 2
+    assert len(calls) == 4
+
+    objective.objective_function_kwargs = {"scale": 2}
+    objective.evaluate(case)
+    assert len(calls) == 5
+
+
+def test_normalization_refit_interval():
+    step = ScikitNormalizationStep(MinMaxScaler(), refit_interval=2)
+    assert step.evaluate([0.0, 2.0]).tolist() == [0.0, 1.0]
+
+    # Not re-fitted: normalized with the previous min-max range
+    assert step.evaluate([0.0, 4.0]).tolist() == [0.0, 2.0]
+    assert step.evaluate([0.0, 4.0]).tolist() == [0.0, 1.0]
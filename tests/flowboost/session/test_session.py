@@ -1,5 +1,6 @@
 import json
 import logging
+import os
 from pathlib import Path
 
 import pytest
@@ -11,27 +12,72 @@ from flowboost.optimizer.search_space import Dimension
 from flowboost.session.session import Session
 
 
+def constant_objective(case: Case) -> float:
+    return 1.0
+
+
 @pytest.fixture
 def test_session(tmp_path):
-    session = Session(
+    # Session data lives in tmp_path, which pytest cleans up
+    return Session(
         name="My cool optimization campaign",
-        data_dir=Path("~/foamboost_test").expanduser(),
+        data_dir=Path(tmp_path, "foamboost_test"),
     )
-    yield session
-    session._delete_all_data()
 
 
 def test_persistence(test_session: Session):
     # Try persisting session
     test_session.persist()
-    print("Persisted session")
+    logging.info("Persisted session")
 
 
 def test_restore(test_session: Session):
     test_session.persist()
     test_session.restore()
     logging.info(json.dumps(test_session.state(), indent=4))
-    print("Restored session")
+    logging.info("Restored session")
+
+
+def test_case_discovery_cache(test_session: Session):
+    case_dir = Path(test_session.pending_dir, "stage001.01_abcd")
+    case_dir.mkdir()
+
+    # Make the directory mtime old enough to be cached
+    os.utime(case_dir, (0, 0))
+    assert test_session.get_pending_cases() == []
+    assert test_session._foam_dir_cache[str(case_dir)] == (0, False)
+
+    # Adding the sub-directories changes the mtime: rediscovered
+    Path(case_dir, "constant").mkdir()
+    Path(case_dir, "system").mkdir()
+    assert [c.name for c in test_session.get_pending_cases()] == [case_dir.name]
+    assert test_session.get_all_case_names() == [case_dir.name]
+
+
+
+def test_case_restore_cache(test_session: Session):
+    case_dir = Path(test_session.pending_dir, "stage001.01_abcd")
+    case_dir.mkdir()
+    Case(case_dir).persist_to_file()
+    os.utime(Path(case_dir, "metadata.toml"), (0, 0))
+
+    # Each restore builds a new Case from the cached metadata
+    first = test_session._restore_case(str(case_dir))
+    first.success = False
+    second = test_session._restore_case(str(case_dir))
+
+    assert str(case_dir) in test_session._restore_cache
+    assert second is not first
+    assert second.id == first.id
+    assert second.success is None
+
+
+def test_next_stage_prefix(test_session: Session):
+    for name in ("stage002.01_abcd", "stage007.02_efgh", "123_notes", "7"):
+        Path(test_session.pending_dir, name).mkdir()
+
+    # Only directories named like generated cases count as stages
+    assert test_session._get_next_stage_prefix() == 8
 
 
 def test_incorrect_startup():
@@ -42,10 +88,10 @@ def test_incorrect_startup():
     pass
 
 
-def test_simple_blank_start(foam_in_env):
+def test_simple_blank_start(tutorial_source, tmp_path):
     # Add objective function
     objective = Objective(
-        name="Test Objective", minimize=True, objective_function=lambda x: 1
+        name="Test Objective", minimize=True, objective_function=constant_objective
     )
 
     # Define what to modify
@@ -58,7 +104,7 @@ def test_simple_blank_start(foam_in_env):
 
     session = Session(
         name="My cool optimization campaign",
-        data_dir=Path("~/test_campaign_flowboost").expanduser(),
+        data_dir=Path(tmp_path, "test_campaign_flowboost"),
         dataframe_format="polars",
     )
 
@@ -66,20 +112,16 @@ def test_simple_blank_start(foam_in_env):
     session.backend.set_search_space([dim])
     session.backend.set_objectives([objective])
 
-    # Template
-    aachen_case = Case.from_tutorial(
-        "multicomponentFluid/aachenBomb", Path(session.data_dir, "aachenBomb_template")
-    )
-
-    session.attach_template_case(aachen_case)
+    # Template: shared between tests, and only ever cloned by the session
+    session.attach_template_case(Case(tutorial_source))
     new_cases = session.start()
 
     assert new_cases, "Optimizer did not provide new cases"
 
     # Evaluate objectives
     output = session.backend.batch_process(new_cases)
-    print("Objective function evaluated")
+    logging.info("Objective function evaluated")
     for i, out in enumerate(output, 1):
-        print(f"[{i}] {out}")
+        logging.debug(f"[{i}] {out}")
 
     # session._delete_all_data()
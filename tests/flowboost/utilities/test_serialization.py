@@ -0,0 +1,26 @@
+import json
+
+from flowboost.utilities import serialization
+
+
+def test_dump_streaming(tmp_path):
+    path = tmp_path / "snapshot.json"
+    entries = {0: {"x": 1.5}, 1: {"x": 2.0}}
+    serialization.dump_streaming(
+        {"optimizer": "AxBackend"}, "parametrizations", entries.items(), path
+    )
+
+    with open(path, "r") as f:
+        data = json.load(f)
+
+    assert data == {
+        "optimizer": "AxBackend",
+        "parametrizations": {"0": {"x": 1.5}, "1": {"x": 2.0}},
+    }
+    assert serialization.load(path) == data
+
+
+def test_dump_streaming_empty(tmp_path):
+    path = tmp_path / "snapshot.json"
+    serialization.dump_streaming({}, "parametrizations", [], path)
+    assert serialization.load(path) == {"parametrizations": {}}
@@ -1,6 +1,7 @@
+import time
 from datetime import timedelta
 
-from flowboost.utilities.time import td_format
+from flowboost.utilities.time import MTIME_SETTLE_NS, mtime_is_settled, td_format
 
 
 def test_seconds():
@@ -78,3 +79,15 @@ def test_negative_duration_with_precision():
 def test_zero_seconds_with_precision():
     # Zero seconds should ignore precision and return "In the past"
     assert td_format(timedelta(seconds=0), precision=3) == "In the past"
+
+
+def test_seconds_as_number():
+    assert td_format(90) == "1 minute, 30 seconds"
+    assert td_format(3600.7) == "1 hour"
+
+
+def test_mtime_is_settled():
+    now = time.time_ns()
+    assert mtime_is_settled(0)
+    assert mtime_is_settled(now - 2 * MTIME_SETTLE_NS)
+    assert not mtime_is_settled(now)